@@ -9,7 +9,10 @@ This setup is crucial for ensuring that messages
 are not lost and can be debugged
 if they fail to be processed after multiple retries.
 """
+import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
 from google.api_core.exceptions import AlreadyExists
 from google.cloud import pubsub_v1
@@ -36,25 +39,109 @@ except ImportError:
         {"topic": "customer-created", "subscription": "customer-created-sub"}
     ]
 
+# Paths already provisioned by previous runs, so warm restarts skip the RPCs.
+# The emulator loses its state on restart, so nothing is cached against it.
+CACHE_FILE = Path.home() / ".cache" / f"pubsub_init_{PROJECT_ID}.json"
+CACHE_ENABLED = not os.getenv("PUBSUB_EMULATOR_HOST")
+
+
+def load_known_paths() -> set[str]:
+    """Loads the provisioned resource paths cached on disk."""
+    if not CACHE_ENABLED:
+        return set()
+    try:
+        return set(json.loads(CACHE_FILE.read_text()))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_known_paths() -> None:
+    """Persists the provisioned resource paths for the next run."""
+    if not CACHE_ENABLED:
+        return
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(sorted(KNOWN_PATHS)))
+    except OSError as e:
+        logger.warning("Could not write Pub/Sub cache {}: {}", CACHE_FILE, e)
+
+
+KNOWN_PATHS = load_known_paths()
+
 
 def create_topic(
     publisher: pubsub_v1.PublisherClient, topic_path: str
 ) -> None:
     """Creates a topic if it doesn't exist."""
+    if topic_path in KNOWN_PATHS:
+        logger.debug("Topic known to exist: {}", topic_path)
+        return
+
     try:
         publisher.create_topic(request={"name": topic_path})
-        logger.info(f"Topic created: {topic_path}")
+        logger.info("Topic created: {}", topic_path)
     except AlreadyExists:
-        logger.warning(f"Topic already exists: {topic_path}")
+        logger.warning("Topic already exists: {}", topic_path)
+
+    KNOWN_PATHS.add(topic_path)
+
+
+def ensure_dead_letter_policy(
+    subscriber: pubsub_v1.SubscriberClient,
+    subscription_path: str,
+    dead_letter_policy: dict[str, str | int],
+) -> None:
+    """Updates the DLQ policy of an existing subscription if it differs."""
+    try:
+        current = subscriber.get_subscription(
+            request={"subscription": subscription_path}
+        ).dead_letter_policy
+        if (
+            current.dead_letter_topic
+            == dead_letter_policy["dead_letter_topic"]
+            and current.max_delivery_attempts
+            == dead_letter_policy["max_delivery_attempts"]
+        ):
+            logger.debug("DLQ policy up to date: {}", subscription_path)
+            return
+
+        update_request = {
+            "subscription": {
+                "name": subscription_path,
+                "dead_letter_policy": dead_letter_policy,
+            },
+            "update_mask": {"paths": ["dead_letter_policy"]},
+        }
+        subscriber.update_subscription(request=update_request)
+        logger.info(
+            "Subscription updated with DLQ policy: {}", subscription_path
+        )
+    except Exception as e:
+        logger.error("Error updating existing subscription: {}", e)
 
 
 def create_subscription(
     subscriber: pubsub_v1.SubscriberClient,
     subscription_path: str,
     topic_path: str,
-    dead_letter_policy: dict[str, str] | None = None,
+    dead_letter_policy: dict[str, str | int] | None = None,
 ) -> None:
-    """Creates a subscription if it doesn't exist."""
+    """
+    Creates a subscription if it doesn't exist.
+
+    An existing subscription, whether known from the cache, the listing or
+    the create attempt, still gets its DLQ policy checked and updated.
+    """
+    if subscription_path in KNOWN_PATHS:
+        logger.debug(
+            "Subscription known to exist: {}", subscription_path
+        )
+        if dead_letter_policy:
+            ensure_dead_letter_policy(
+                subscriber, subscription_path, dead_letter_policy
+            )
+        return
+
     try:
         request = {
             "name": subscription_path,
@@ -66,83 +153,157 @@ def create_subscription(
             request["dead_letter_policy"] = dead_letter_policy
 
         subscriber.create_subscription(request=request)
-        logger.info(f"Subscription created: {subscription_path}")
+        logger.info("Subscription created: {}", subscription_path)
     except AlreadyExists:
-        logger.warning(f"Subscription already exists: {subscription_path}")
+        logger.warning("Subscription already exists: {}", subscription_path)
 
-        # Optional: Update DLQ policy if subscription already exists
         if dead_letter_policy:
-            update_request = {
-                "subscription": {
-                    "name": subscription_path,
-                    "dead_letter_policy": dead_letter_policy,
-                },
-                "update_mask": {"paths": ["dead_letter_policy"]},
-            }
-            try:
-                subscriber.update_subscription(request=update_request)
-                logger.info(
-                    "Subscription updated with "
-                    f"DLQ policy: {subscription_path}"
-                )
-            except Exception as e:
-                logger.error(f"Error updating existing subscription: {e}")
+            ensure_dead_letter_policy(
+                subscriber, subscription_path, dead_letter_policy
+            )
 
+    KNOWN_PATHS.add(subscription_path)
 
-def setup_topic_resources(
-    publisher: pubsub_v1.PublisherClient,
-    subscriber: pubsub_v1.SubscriberClient,
-    config: dict[str, str],
-) -> None:
-    """Configures Topic, Subscription and DLQ for a configuration entry."""
+
+def wait_all(futures: list[Future[None]]) -> None:
+    """Waits for all futures, re-raising the first failure."""
+    for future in futures:
+        future.result()
+
+
+def resource_paths(config: dict[str, str]) -> dict[str, str]:
+    """Builds the full paths of the resources of a configuration entry."""
     topic_name = config["topic"]
     sub_name = config["subscription"]
 
-    # DLQ names
-    dlq_topic_name = f"{topic_name}-dlq"
-    dlq_sub_name = f"{sub_name}-dlq"
+    return {
+        "main_topic": pubsub_v1.PublisherClient.topic_path(
+            PROJECT_ID, topic_name
+        ),
+        "main_sub": pubsub_v1.SubscriberClient.subscription_path(
+            PROJECT_ID, sub_name
+        ),
+        # DLQ names
+        "dlq_topic": pubsub_v1.PublisherClient.topic_path(
+            PROJECT_ID, f"{topic_name}-dlq"
+        ),
+        "dlq_sub": pubsub_v1.SubscriberClient.subscription_path(
+            PROJECT_ID, f"{sub_name}-dlq"
+        ),
+    }
+
+
+def list_existing_paths(
+    publisher: pubsub_v1.PublisherClient,
+    subscriber: pubsub_v1.SubscriberClient,
+) -> set[str]:
+    """
+    Lists the topics and subscriptions that already exist in the project.
 
-    # Full paths
-    main_topic_path = publisher.topic_path(PROJECT_ID, topic_name)
-    main_sub_path = subscriber.subscription_path(PROJECT_ID, sub_name)
+    One paginated listing per resource type replaces a CreateTopic or
+    CreateSubscription attempt per resource. On failure, nothing is
+    returned and every resource falls back to create-and-catch.
+    """
+    project_path = f"projects/{PROJECT_ID}"
+    try:
+        topics = publisher.list_topics(request={"project": project_path})
+        subscriptions = subscriber.list_subscriptions(
+            request={"project": project_path}
+        )
+        return {topic.name for topic in topics} | {
+            subscription.name for subscription in subscriptions
+        }
+    except Exception as e:
+        logger.warning("Could not list existing Pub/Sub resources: {}", e)
+        return set()
 
-    dlq_topic_path = publisher.topic_path(PROJECT_ID, dlq_topic_name)
-    dlq_sub_path = subscriber.subscription_path(PROJECT_ID, dlq_sub_name)
 
-    # 1. Create DLQ Topic
-    create_topic(publisher, dlq_topic_path)
+def setup_topic_resources(
+    publisher: pubsub_v1.PublisherClient,
+    subscriber: pubsub_v1.SubscriberClient,
+    config: dict[str, str],
+    executor: ThreadPoolExecutor,
+) -> None:
+    """
+    Configures Topic, Subscription and DLQ for a configuration entry.
 
-    # 2. Create DLQ Subscription
-    # DLQs usually don't have another DLQ, so no policy here.
-    create_subscription(subscriber, dlq_sub_path, dlq_topic_path)
+    The RPCs are I/O-bound, so independent ones are dispatched concurrently
+    on the shared executor: both topics first, then both subscriptions
+    (a subscription requires its topic to exist).
+    """
+    paths = resource_paths(config)
+    main_topic_path = paths["main_topic"]
+    main_sub_path = paths["main_sub"]
+    dlq_topic_path = paths["dlq_topic"]
+    dlq_sub_path = paths["dlq_sub"]
 
-    # 3. Create Main Topic
-    create_topic(publisher, main_topic_path)
+    # 1. Create DLQ Topic and Main Topic
+    wait_all(
+        [
+            executor.submit(create_topic, publisher, dlq_topic_path),
+            executor.submit(create_topic, publisher, main_topic_path),
+        ]
+    )
 
-    # 4. Create Main Subscription pointing to the DLQ
-    # Configure to send to DLQ after 5 failed attempts
-    dlq_policy = {
+    # 2. Create DLQ Subscription and Main Subscription pointing to the DLQ
+    # DLQs usually don't have another DLQ, so no policy there.
+    # Configure the main one to send to DLQ after 5 failed attempts
+    dlq_policy: dict[str, str | int] = {
         "dead_letter_topic": dlq_topic_path,
         "max_delivery_attempts": 5,
     }
 
-    create_subscription(
-        subscriber,
-        main_sub_path,
-        main_topic_path,
-        dead_letter_policy=dlq_policy,
+    wait_all(
+        [
+            executor.submit(
+                create_subscription, subscriber, dlq_sub_path, dlq_topic_path
+            ),
+            executor.submit(
+                create_subscription,
+                subscriber,
+                main_sub_path,
+                main_topic_path,
+                dead_letter_policy=dlq_policy,
+            ),
+        ]
     )
 
 
 def init_pubsub() -> None:
     """Orchestrates the creation of Pub/Sub resources."""
-    logger.info(f"Starting Pub/Sub configuration in project: {PROJECT_ID}")
+    logger.info("Starting Pub/Sub configuration in project: {}", PROJECT_ID)
 
+    # Both clients are thread-safe and shared by all workers
     publisher = pubsub_v1.PublisherClient()
     subscriber = pubsub_v1.SubscriberClient()
 
-    for config in TOPICS_CONFIG:
-        setup_topic_resources(publisher, subscriber, config)
+    # Resources already known to exist need no RPC at all; otherwise a
+    # single listing tells which ones are missing
+    required = {
+        path
+        for config in TOPICS_CONFIG
+        for path in resource_paths(config).values()
+    }
+    if not required <= KNOWN_PATHS:
+        KNOWN_PATHS.update(list_existing_paths(publisher, subscriber))
+
+    # Each entry holds one worker while waiting on at most two RPCs, so
+    # four workers per entry can never starve the pool.
+    with ThreadPoolExecutor(max_workers=len(TOPICS_CONFIG) * 4) as executor:
+        wait_all(
+            [
+                executor.submit(
+                    setup_topic_resources,
+                    publisher,
+                    subscriber,
+                    config,
+                    executor,
+                )
+                for config in TOPICS_CONFIG
+            ]
+        )
+
+    save_known_paths()
 
     logger.success("Pub/Sub configuration complete!")
 
@@ -8,4 +8,4 @@ if [ -z "$APP_PORT" ]; then
 fi
 
 echo "Iniciando aplicação na porta $APP_PORT..."
-uvicorn src.main:app --host 0.0.0.0 --port $APP_PORT
\ No newline at end of file
+uvicorn src.main:app --host 0.0.0.0 --port $APP_PORT --loop uvloop
\ No newline at end of file
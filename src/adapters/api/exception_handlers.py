@@ -0,0 +1,51 @@
+"""
+Application-level exception handlers.
+
+This module translates exceptions raised by the endpoints into HTTP
+responses in a single place, so routes do not need their own try/except
+blocks.
+"""
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+
+from src.domain.exceptions import CustomerAlreadyExistsError
+
+
+async def customer_already_exists_handler(
+    request: Request, exc: Exception
+) -> ORJSONResponse:
+    """Maps a duplicated customer to 409 Conflict."""
+    logger.warning("Business rule violation: {}", exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_409_CONFLICT, content={"detail": str(exc)}
+    )
+
+
+async def unhandled_exception_handler(
+    request: Request, exc: Exception
+) -> ORJSONResponse:
+    """
+    Maps any unexpected error to 500 with a generic body.
+
+    It does not log: handlers for `Exception` run in Starlette's
+    `ServerErrorMiddleware`, which re-raises the error afterwards, and the
+    server then logs its traceback.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "An internal error occurred."},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Registers the exception handlers on the application.
+
+    Args:
+        app: The FastAPI application.
+    """
+    app.add_exception_handler(
+        CustomerAlreadyExistsError, customer_already_exists_handler
+    )
+    app.add_exception_handler(Exception, unhandled_exception_handler)
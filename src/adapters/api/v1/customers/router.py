@@ -4,11 +4,9 @@ API Router for Customer Management.
 This module defines the FastAPI router for handling customer-related
 endpoints, such as creating, retrieving, and updating customers.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from loguru import logger
+from fastapi import APIRouter, Depends
 
 from src.di.v1.get_create_customer_uc import get_initiate_customer_creation_uc
-from src.domain.exceptions import CustomerAlreadyExistsError
 from src.usecases.v1.customers.create_customer import InitiateCustomerCreation
 from src.usecases.v1.schemas.api.customer import CustomerCreate, CustomerRead
 
@@ -45,18 +43,10 @@ async def create_customer(
         confirming that the process has been initiated.
 
     Raises:
-        HTTPException (409 Conflict): If a customer with the same email
-            already exists.
-        HTTPException (500 Internal Server Error): For any other unexpected
-            errors during the initiation process.
+        CustomerAlreadyExistsError: If a customer with the same email
+            already exists, mapped to 409 Conflict by the application's
+            exception handlers.
+        Exception: Any other unexpected error, mapped to 500 Internal
+            Server Error by the application's exception handlers.
     """
-    try:
-        return await controller.execute(payload)
-    except CustomerAlreadyExistsError as e:
-        logger.warning(f"Business rule violation: {e}")
-        raise HTTPException(status_code=409, detail=str(e))
-    except Exception as e:
-        logger.exception(f"Unhandled error initiating customer creation: {e}")
-        raise HTTPException(
-            status_code=500, detail="An internal error occurred."
-        )
+    return await controller.execute(payload)
@@ -4,13 +4,12 @@ Health check endpoints for the service.
 This module provides routers for liveness and readiness probes.
 """
 import asyncio
-from collections.abc import AsyncGenerator
+import time
 
 from fastapi import APIRouter, Depends, Response, status
 from google.cloud.pubsub_v1 import PublisherClient
 from redis.asyncio import Redis as AsyncRedis
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncConnection
 
 from src.adapters.database.session import engine
 from src.config.settings import settings
@@ -21,6 +20,32 @@ from src.di.v1.get_create_customer_uc import (
 
 router = APIRouter()
 
+# The probed topic never changes, so its path is formatted once at import.
+_CUSTOMER_TOPIC_PATH = PublisherClient.topic_path(
+    settings.PUBSUB_PROJECT_ID, settings.CUSTOMER_CREATE_TOPIC
+)
+
+# Healthy results are reused for a while instead of being re-fetched on
+# every probe: GetTopic is an admin RPC with a tight per-project quota, and
+# `SELECT 1` costs a pool checkout plus a round-trip. Failures are never
+# cached, so a failing dependency is re-checked on the next probe.
+_POSTGRES_STATUS_TTL_SECONDS = 60.0
+_PUBSUB_STATUS_TTL_SECONDS = 60.0
+_last_ok: dict[str, float] = {}
+
+
+def _is_fresh(service: str, ttl: float) -> bool:
+    """Tells whether `service` was last seen healthy less than `ttl` ago."""
+    last_ok = _last_ok.get(service)
+    return last_ok is not None and time.monotonic() - last_ok < ttl
+
+
+def _record(service: str, result: str) -> str:
+    """Remembers when `service` was healthy and returns its status."""
+    if result == "ok":
+        _last_ok[service] = time.monotonic()
+    return result
+
 
 @router.get("/live", status_code=status.HTTP_200_OK)
 async def liveness_probe() -> dict[str, str]:
@@ -30,19 +55,19 @@ async def liveness_probe() -> dict[str, str]:
     return {"status": "ok"}
 
 
-async def get_db_connection() -> AsyncGenerator[AsyncConnection]:
+async def check_postgres() -> str:
     """
-    Dependency to get a database connection.
-    """
-    async with engine.connect() as connection:
-        yield connection
-
+    Check database connection.
 
-async def check_postgres(db: AsyncConnection) -> str:
-    """Check database connection."""
-    try:
-        await db.execute(text("SELECT 1"))
+    A pool connection is only checked out when the cached healthy status
+    has expired.
+    """
+    if _is_fresh("postgres", _POSTGRES_STATUS_TTL_SECONDS):
         return "ok"
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        return _record("postgres", "ok")
     except Exception as e:
         return f"error: {e}"
 
@@ -68,38 +93,47 @@ def _check_pubsub_blocking(
 
 
 async def check_pubsub(pubsub_client: PublisherClient) -> str:
-    """Check Pub/Sub topic existence via a thread pool."""
-    topic_path = pubsub_client.topic_path(
-        settings.PUBSUB_PROJECT_ID, settings.CUSTOMER_CREATE_TOPIC
-    )
-    return await asyncio.to_thread(
-        _check_pubsub_blocking, pubsub_client, topic_path
+    """
+    Check Pub/Sub topic existence via a thread pool.
+
+    The admin RPC is only issued when the cached healthy status has
+    expired.
+    """
+    if _is_fresh("pubsub", _PUBSUB_STATUS_TTL_SECONDS):
+        return "ok"
+    result = await asyncio.to_thread(
+        _check_pubsub_blocking, pubsub_client, _CUSTOMER_TOPIC_PATH
     )
+    return _record("pubsub", result)
 
 
 @router.get("/ready")
 async def readiness_probe(
     response: Response,
-    db: AsyncConnection = Depends(get_db_connection),
     redis_client: AsyncRedis = Depends(get_redis_client),
     pubsub_client: PublisherClient = Depends(get_pubsub_client),
 ) -> dict[str, str]:
     """
     Readiness probe: Concurrently checks all external dependencies.
 
-    Returns a detailed status of each service. If any service fails,
-    the endpoint will return a 503 Service Unavailable status code.
+    Returns a detailed status of each service. If any service fails, or
+    does not answer within `HEALTH_CHECK_TIMEOUT_SECONDS`, the endpoint
+    will return a 503 Service Unavailable status code.
     """
-    results = await asyncio.gather(
-        check_postgres(db),
-        check_redis(redis_client),
-        check_pubsub(pubsub_client),
+    checks = {
+        "postgres": asyncio.ensure_future(check_postgres()),
+        "redis": asyncio.ensure_future(check_redis(redis_client)),
+        "pubsub": asyncio.ensure_future(check_pubsub(pubsub_client)),
+    }
+    _, pending = await asyncio.wait(
+        checks.values(), timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS
     )
+    for task in pending:
+        task.cancel()
 
     service_statuses = {
-        "postgres": results[0],
-        "redis": results[1],
-        "pubsub": results[2],
+        name: "error: timeout" if task in pending else task.result()
+        for name, task in checks.items()
     }
 
     if any(status != "ok" for status in service_statuses.values()):
@@ -4,6 +4,7 @@ This module provides an implementation of the ICacheRepository using Redis.
 The RedisCache class uses the redis-py async client to interact with a Redis
 server. It supports transactional operations through Redis pipelines.
 """
+from contextvars import ContextVar, Token
 from types import TracebackType
 
 import redis.asyncio as redis
@@ -17,7 +18,10 @@ class RedisCache(ICacheRepository[str, str]):
     An implementation of the ICacheRepository that uses Redis as a backend.
 
     This class supports atomic operations through Redis pipelines, which are
-    used as transactions.
+    used as transactions. The active pipeline is scoped to the current
+    task through a context variable, so a shared instance can run
+    concurrent transactions; idle pipelines are kept and reused instead of
+    being allocated per transaction.
     """
 
     def __init__(self, client: redis.Redis) -> None:
@@ -25,10 +29,15 @@ class RedisCache(ICacheRepository[str, str]):
         Initializes the Redis client.
 
         Args:
-            client: An instance of redis.Redis.
+            client: An instance of redis.Redis created with
+                `decode_responses=True`, so values are returned as `str`.
         """
         self.client = client
-        self._pipeline: Pipeline | None = None
+        self._pipeline_var: ContextVar[Pipeline | None] = ContextVar(
+            f"redis_pipeline_{id(self)}", default=None
+        )
+        self._tokens: dict[int, Token[Pipeline | None]] = {}
+        self._idle_pipelines: list[Pipeline] = []
 
     @property
     def pipeline(self) -> Pipeline:
@@ -36,19 +45,25 @@ class RedisCache(ICacheRepository[str, str]):
         Returns the current pipeline, raising a RuntimeError if no
         transaction is active.
         """
-        if not self._pipeline:
+        pipeline = self._pipeline_var.get()
+        if not pipeline:
             raise RuntimeError(
                 "Transaction not started. Use 'async with repository' "
                 "before performing write operations."
             )
-        return self._pipeline
+        return pipeline
 
     async def __aenter__(self) -> "RedisCache":
         """
         Starts a pipeline to group commands (transaction).
         """
-        # Starts the pipeline to group commands (transaction)
-        self._pipeline = self.client.pipeline()
+        # Reuses an idle pipeline; its command queue is empty between
+        # transactions, since both execute and rollback clear it
+        if self._idle_pipelines:
+            pipeline = self._idle_pipelines.pop()
+        else:
+            pipeline = self.client.pipeline(transaction=True)
+        self._tokens[id(pipeline)] = self._pipeline_var.set(pipeline)
         return self
 
     async def __aexit__(
@@ -60,26 +75,37 @@ class RedisCache(ICacheRepository[str, str]):
         """
         Manages the transaction lifecycle, committing or rolling back on exit.
         """
-        if self._pipeline:
+        pipeline = self._pipeline_var.get()
+        if not pipeline:
+            return
+        try:
             if exc_type:
                 await self.rollback()
             else:
                 await self.commit()
-            self._pipeline = None
+        finally:
+            self._pipeline_var.reset(self._tokens.pop(id(pipeline)))
+            self._idle_pipelines.append(pipeline)
 
     async def commit(self) -> None:
         """
-        Executes the pipeline.
+        Executes the pipeline, skipping the round-trip if nothing was queued.
         """
-        await self.pipeline.execute()
+        pipeline = self.pipeline
+        if not pipeline.command_stack:
+            return
+        await pipeline.execute()
 
     async def rollback(self) -> None:
         """
         Discards the pipeline.
         """
-        if self._pipeline:
-            # Clears the pipeline's command queue without executing
-            await self._pipeline.reset()  # type: ignore[no-untyped-call]
+        pipeline = self._pipeline_var.get()
+        if pipeline:
+            # Nothing was sent yet (commands are buffered until execute), so
+            # dropping the local queue is enough. The pipeline never WATCHes
+            # and so holds no connection that `reset()` would need to release.
+            pipeline.command_stack.clear()
 
     async def get(self, key: str) -> str | None:
         """
@@ -92,8 +118,8 @@ class RedisCache(ICacheRepository[str, str]):
             The value associated with the key, or None if the key is not found.
         """
         # Direct read (outside the transaction to get current data)
-        value = await self.client.get(key)
-        return str(value) if value is not None else None
+        value: str | None = await self.client.get(key)
+        return value
 
     async def exists(self, key: str) -> bool:
         """
@@ -105,7 +131,8 @@ class RedisCache(ICacheRepository[str, str]):
         Returns:
             True if the key exists, False otherwise.
         """
-        return bool(await self.client.exists(key) > 0)
+        count: int = await self.client.exists(key)
+        return count == 1
 
     async def set(
         self, key: str, value: str, expire: int | None = None
@@ -120,6 +147,33 @@ class RedisCache(ICacheRepository[str, str]):
         """
         await self.pipeline.set(key, value, ex=expire)
 
+    async def acquire_lock(self, key: str, value: str, expire: int) -> bool:
+        """
+        Sets a key only if it is absent, in a single atomic command.
+
+        It runs outside the transaction (`SET NX EX`), so the lock is held
+        as soon as this returns and concurrent callers cannot both get it.
+
+        Args:
+            key: The lock key.
+            value: The value to store.
+            expire: The lock expiration time in seconds.
+
+        Returns:
+            True if the lock was acquired, False if the key already exists.
+        """
+        acquired = await self.client.set(key, value, nx=True, ex=expire)
+        return bool(acquired)
+
+    async def release_lock(self, key: str) -> None:
+        """
+        Releases a lock taken with `acquire_lock`, outside the transaction.
+
+        Args:
+            key: The lock key.
+        """
+        await self.client.delete(key)
+
     async def delete(self, key: str) -> None:
         """
         Deletes a key from the cache.
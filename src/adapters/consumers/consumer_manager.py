@@ -5,6 +5,7 @@ This module provides a `ConsumerManager` class that allows for centralized
 control over starting and stopping a collection of consumer instances.
 """
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
 
@@ -39,14 +40,27 @@ class ConsumerManager:
         """
         Starts the message consumption for all registered consumers.
 
-        This method iterates through the list of consumers and calls the
-        `start()` method on each one. It logs the start of the process and
-        any errors encountered while starting a specific consumer.
+        The `start()` method of each consumer is called concurrently on a
+        thread pool, so the subscription handshakes overlap instead of
+        adding up. It logs the start of the process and any errors
+        encountered while starting a specific consumer.
         """
         logger.info(f"Starting {len(self.consumers)} consumers...")
-        for consumer in self.consumers:
+        if not self.consumers:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.consumers),
+            thread_name_prefix="consumer-start",
+        ) as executor:
+            futures = {
+                consumer: executor.submit(consumer.start)
+                for consumer in self.consumers
+            }
+
+        for consumer, future in futures.items():
             try:
-                consumer.start()
+                future.result()
             except Exception as e:
-                # Log the error but attempt to start the other consumers
+                # Log the error but keep the other consumers running
                 logger.error(f"Failed to start consumer {consumer}: {e}")
@@ -0,0 +1,153 @@
+"""
+Message handler that groups messages into batches.
+
+This module defines the `BatchingHandler`, which wraps a handler supporting
+batches and persists the inputs of several messages in a single Unit of
+Work, instead of opening one transaction per message.
+"""
+import asyncio
+import contextvars
+from typing import Any
+
+from loguru import logger
+
+from src.config.settings import settings
+from src.usecases.ports.consumer_handler_interface import (
+    BaseBatchUseCaseHandler,
+    IConsumerHandler,
+)
+
+
+class BatchingHandler[TMessage, TInput](IConsumerHandler[TMessage]):
+    """
+    Accumulates message inputs and processes them in batches.
+
+    Each call to `handle_message` enqueues the input extracted from the
+    message and waits until its batch is processed, so the caller still
+    acks or nacks every message individually. A single flusher task drains
+    the queue whenever `max_batch_size` inputs are waiting or
+    `flush_interval` seconds have passed since the first one arrived.
+
+    The wrapped handler reports the outcome of each input, so a single bad
+    message does not fail the messages batched with it.
+
+    Attributes:
+        handler: The wrapped handler that processes the batches.
+        max_batch_size: Maximum number of inputs processed together.
+        flush_interval: Seconds a batch waits for more inputs.
+    """
+
+    def __init__(
+        self,
+        handler: BaseBatchUseCaseHandler[TMessage, TInput, Any],
+        max_batch_size: int = settings.CONSUMER_BATCH_SIZE,
+        flush_interval: float = settings.CONSUMER_BATCH_FLUSH_INTERVAL,
+    ):
+        """
+        Initializes the BatchingHandler.
+
+        Args:
+            handler: The handler used to extract inputs and process batches.
+            max_batch_size: Maximum number of inputs processed together.
+            flush_interval: Seconds a batch waits for more inputs before it
+                is processed.
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[tuple[TInput, asyncio.Future[None]]] = (
+            asyncio.Queue()
+        )
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def handle_message(
+        self, message: TMessage, context: dict[str, Any]
+    ) -> None:
+        """
+        Enqueues the message input and waits for its batch to be processed.
+
+        Args:
+            message: The message to be processed.
+            context: A dictionary with message context.
+
+        Raises:
+            Exception: Propagates errors from input extraction or from the
+                processing of this message's input.
+        """
+        input_data = self.handler.extract_input(message, context)
+        done = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((input_data, done))
+
+        # The flusher is started lazily, on the loop that runs the handler.
+        # It gets an empty context: copying the caller's would tag every
+        # later log line with this message's correlation id
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(
+                self._flush_forever(), context=contextvars.Context()
+            )
+
+        await done
+
+    async def _flush_forever(self) -> None:
+        """Collects batches from the queue and processes them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except TimeoutError:
+                    break
+            await self._process(batch)
+
+    async def _process(
+        self, batch: list[tuple[TInput, asyncio.Future[None]]]
+    ) -> None:
+        """
+        Processes a batch and completes the futures of its callers.
+
+        Any failure, including a wrapped handler that reports the wrong
+        number of outcomes, fails every future of the batch instead of
+        stopping the flusher with callers still waiting.
+
+        Args:
+            batch: The inputs paired with the futures their callers await.
+        """
+        try:
+            errors = await self.handler.handle_batch(
+                [item for item, _ in batch]
+            )
+            outcomes = list(zip(batch, errors, strict=True))
+        except asyncio.CancelledError:
+            for _, done in batch:
+                done.cancel()
+            raise
+        except Exception as e:
+            # The Unit of Work itself failed (e.g. on commit)
+            logger.opt(exception=e).error(
+                "Batch of {} failed: {}", len(batch), e
+            )
+            for _, done in batch:
+                self._resolve(done, e)
+            return
+
+        for (_, done), error in outcomes:
+            self._resolve(done, error)
+
+    @staticmethod
+    def _resolve(
+        done: asyncio.Future[None], error: Exception | None = None
+    ) -> None:
+        """Completes a caller's future unless it was already cancelled."""
+        if done.done():
+            return
+        if error is None:
+            done.set_result(None)
+        else:
+            done.set_exception(error)
@@ -5,31 +5,71 @@ This module defines the `CreateCustomerHandler`, which is responsible for
 processing messages related to customer creation, adapting them, and
 executing the corresponding use case.
 """
+import functools
 from collections.abc import Callable
-from typing import Any
+from datetime import datetime
+from typing import Any, NotRequired, TypedDict
+from uuid import UUID
 
 from loguru import logger
 
 from src.domain.entities.customer import Customer
 from src.domain.entities.message import Message
+from src.domain.exceptions import CustomerAlreadyExistsError
 from src.domain.value_objects.email import Email
-from src.usecases.ports.consumer_handler_interface import BaseUseCaseHandler
-from src.usecases.v1.customers.create_customer import CustomerCreateUseCase
+from src.usecases.ports.consumer_handler_interface import (
+    BaseBatchUseCaseHandler,
+)
+from src.usecases.v1.customers.create_customer import (
+    CustomerBatchCreateUseCase,
+    CustomerCreateUseCase,
+)
 from src.usecases.v1.customers.ports.customer_repositories import (
     IDBCustomerRepository,
 )
 from src.usecases.v1.schemas.api.customer import CustomerRead
 
 
+class EmailPayload(TypedDict):
+    """Wire format of the `Email` value object."""
+
+    value: str
+
+
+class CreateCustomerPayload(TypedDict):
+    """Wire format of a `Customer` in a customer creation message."""
+
+    id: str
+    name: str
+    email: EmailPayload
+    created_at: NotRequired[str]
+    updated_at: NotRequired[str]
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_email(value: str) -> Email:
+    """
+    Builds an `Email`, reusing instances for addresses seen recently.
+
+    `Email` is immutable, so redeliveries and retries of the same address
+    can share one validated instance instead of re-running validation.
+    """
+    return Email(value)
+
+
 class CreateCustomerHandler(
-    BaseUseCaseHandler[Message[dict[Any, Any]], Customer, CustomerRead]
+    BaseBatchUseCaseHandler[
+        Message[CreateCustomerPayload], Customer, CustomerRead
+    ]
 ):
     """
     Handles messages for creating a new customer.
 
     This handler extracts customer data from a message, transforms it into a
     `Customer` domain entity, and then executes the `CustomerCreateUseCase`
-    within a managed unit of work.
+    within a managed unit of work. Batches of entities are persisted with
+    the `CustomerBatchCreateUseCase` in a single unit of work, falling back
+    to one savepoint per entity when the batch fails.
     """
 
     def __init__(
@@ -38,21 +78,34 @@ class CreateCustomerHandler(
         usecase_factory: Callable[
             [IDBCustomerRepository], CustomerCreateUseCase
         ],
+        batch_usecase_factory: Callable[
+            [IDBCustomerRepository], CustomerBatchCreateUseCase
+        ],
     ):
         """
         Initializes the CreateCustomerHandler.
 
+        The factories are called for every unit of work on purpose: once
+        per message in `handle_message` and once per batch in
+        `handle_batch`. Messages and batches are processed concurrently on
+        the event loop, and an `AsyncSession` must not be shared between
+        concurrent tasks, so a cached Unit of Work would interleave
+        unrelated transactions.
+
         Args:
-            uow_factory: A callable that returns a Unit of Work instance,
+            uow_factory: A callable that returns a new Unit of Work instance,
                 providing access to the customer repository.
             usecase_factory: A callable that takes a repository and returns
                 an instance of the `CustomerCreateUseCase`.
+            batch_usecase_factory: A callable that takes a repository and
+                returns an instance of the `CustomerBatchCreateUseCase`.
         """
         self.uow_factory = uow_factory
         self.usecase_factory = usecase_factory
+        self.batch_usecase_factory = batch_usecase_factory
 
     def extract_input(
-        self, message: Message[dict[Any, Any]], context: dict[str, Any]
+        self, message: Message[CreateCustomerPayload], context: dict[str, Any]
     ) -> Customer:
         """
         Extracts and transforms the message payload into a Customer entity.
@@ -65,14 +118,20 @@ class CreateCustomerHandler(
             A `Customer` domain entity populated with data from the message.
         """
         payload = message.data
-        return Customer(
-            id=payload["id"],
+        customer = Customer(
+            id=UUID(payload["id"]),
             name=payload["name"],
-            email=Email(str(payload["email"]["value"])),
+            email=_make_email(payload["email"]["value"]),
         )
+        # Keeps the timestamps reported to the client when it was accepted
+        if "created_at" in payload:
+            customer.created_at = datetime.fromisoformat(payload["created_at"])
+        if "updated_at" in payload:
+            customer.updated_at = datetime.fromisoformat(payload["updated_at"])
+        return customer
 
     async def handle_message(
-        self, message: Message[dict[Any, Any]], context: dict[str, Any]
+        self, message: Message[CreateCustomerPayload], context: dict[str, Any]
     ) -> None:
         """
         Processes the customer creation message.
@@ -87,10 +146,58 @@ class CreateCustomerHandler(
             message: The message to be processed.
             context: A dictionary with message context.
         """
-        logger.info(f"Worker received message. ID: {message.id}")
+        logger.debug("Worker received message. ID: {}", message.id)
 
         input_data = self.extract_input(message, context)
 
+        try:
+            async with self.uow_factory() as uow:
+                use_case = self.usecase_factory(uow)
+                await use_case.execute(input_data)
+        except CustomerAlreadyExistsError as e:
+            # Redelivering the message could never succeed
+            logger.warning("Skipping duplicate customer: {}", e)
+
+    async def handle_batch(
+        self, inputs: list[Customer]
+    ) -> list[Exception | None]:
+        """
+        Persists several customers within a single Unit of Work.
+
+        The batch is first written at once. If that fails, each customer is
+        retried in its own savepoint, still within the same transaction, so
+        a single failing customer does not fail the others. A customer
+        that already exists counts as processed, since redelivering its
+        message can never succeed.
+
+        Args:
+            inputs: The `Customer` entities extracted from the messages.
+
+        Returns:
+            For each customer, the error that prevented its creation or None.
+        """
         async with self.uow_factory() as uow:
+            try:
+                async with uow.savepoint():
+                    await self.batch_usecase_factory(uow).execute(inputs)
+                return [None] * len(inputs)
+            except Exception as e:
+                logger.warning(
+                    "Batch of {} failed ({}); retrying one by one",
+                    len(inputs),
+                    e,
+                )
+
             use_case = self.usecase_factory(uow)
-            await use_case.execute(input_data)
+            errors: list[Exception | None] = []
+            for customer in inputs:
+                try:
+                    async with uow.savepoint():
+                        await use_case.execute(customer)
+                    errors.append(None)
+                except CustomerAlreadyExistsError as e:
+                    logger.warning("Skipping duplicate customer: {}", e)
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(e)
+            return errors
@@ -5,14 +5,19 @@ This module provides the `PubSubConsumer` class, which connects to a Google
 Cloud Pub/Sub subscription and processes messages using an injected handler.
 """
 import asyncio
-import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
-from asgi_correlation_id import correlation_id
+import orjson
 from google.cloud.pubsub_v1 import SubscriberClient
 from google.cloud.pubsub_v1.subscriber.message import Message as PubSubMessage
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
+from google.cloud.pubsub_v1.types import FlowControl
 from loguru import logger
 
+from src.adapters.consumers.pubsub_consumers.recent_messages import (
+    RecentMessages,
+)
 from src.config.settings import settings
 from src.domain.entities.message import Message
 from src.usecases.ports.consumer_handler_interface import IConsumerHandler
@@ -35,8 +40,13 @@ class PubSubConsumer(IConsumer):
         handler: The message handler responsible for processing messages.
         client: The Pub/Sub subscriber client.
         subscription_path: The full path to the subscription.
+        max_workers: Number of threads running the subscriber callbacks.
+        max_messages: Maximum number of messages processed concurrently.
+        processing_timeout: Seconds a message may take before it is nacked.
     """
 
+    processing_timeout: float = 60.0
+
     def __init__(
         self,
         subscription_id: str,
@@ -44,6 +54,8 @@ class PubSubConsumer(IConsumer):
         client: SubscriberClient,
         project_id: str = settings.PUBSUB_PROJECT_ID,
         loop: asyncio.AbstractEventLoop | None = None,
+        max_workers: int = settings.PUBSUB_SUBSCRIBER_MAX_WORKERS,
+        max_messages: int = settings.PUBSUB_MAX_MESSAGES,
     ):
         """
         Initializes the PubSubConsumer.
@@ -56,7 +68,14 @@ class PubSubConsumer(IConsumer):
             project_id: The Google Cloud project ID. Defaults to the one in
                 the global settings.
             loop: The asyncio event loop to use. If None, the current running
-                loop is used.
+                loop is used, so the consumer must then be created from
+                within it.
+            max_workers: Size of the callback thread pool. The library
+                default of 10 threads is oversized for a low-rate queue
+                whose callbacks only bridge work onto the event loop.
+            max_messages: Flow control window. Messages stay leased until
+                their coroutine acks or nacks them, so this also bounds
+                how many are processed concurrently on the event loop.
         """
         self.project_id = project_id
         self.subscription_id = subscription_id
@@ -65,7 +84,15 @@ class PubSubConsumer(IConsumer):
         self.subscription_path = self.client.subscription_path(
             self.project_id, self.subscription_id
         )
-        self._loop = loop or asyncio.get_event_loop()
+        self._loop = loop or asyncio.get_running_loop()
+        self.max_workers = max_workers
+        self.max_messages = max_messages
+        # Pub/Sub delivers at least once: redeliveries of messages that were
+        # already processed are acked without running the handler again
+        self._processed = RecentMessages(
+            max_size=settings.PUBSUB_DEDUPE_MAX_SIZE,
+            ttl=settings.PUBSUB_DEDUPE_TTL_SECONDS,
+        )
 
     def __repr__(self) -> str:
         """Returns a string representation of the consumer."""
@@ -84,8 +111,15 @@ class PubSubConsumer(IConsumer):
         """
         logger.info(f"Starting PubSub consumer for: {self.subscription_path}")
         try:
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"pubsub-{self.subscription_id}",
+            )
             self.client.subscribe(
-                self.subscription_path, callback=self.__internal_callback
+                self.subscription_path,
+                callback=self.__internal_callback,
+                scheduler=ThreadScheduler(executor=executor),
+                flow_control=FlowControl(max_messages=self.max_messages),
             )
         except Exception as e:
             logger.error(
@@ -97,86 +131,127 @@ class PubSubConsumer(IConsumer):
         """
         Synchronous callback executed by the Pub/Sub library for each message.
 
-        This method acts as a bridge to the asyncio world. It schedules the
-        asynchronous `_process_message` coroutine to run on the event loop
-        and waits for its completion to acknowledge (ack) or negatively
-        acknowledge (nack) the message.
+        This method acts as a bridge to the asyncio world. The body is
+        parsed here, on the library thread, as it is pure CPU work; only
+        the handler, which awaits I/O, is scheduled on the event loop. The
+        method returns immediately and the `_process_message` coroutine
+        acknowledges (ack) or negatively acknowledges (nack) the message
+        itself, so the library thread is not blocked while it is processed.
 
         Args:
             message: The message received from Pub/Sub.
         """
-        context: dict[Any, Any] = {}
+        logger.debug(
+            "Queue {} received message: {}",
+            self.subscription_id,
+            message.message_id,
+        )
+        if message.message_id in self._processed:
+            logger.debug("Acking redelivered message {}", message.message_id)
+            message.ack()
+            return
+
+        context: dict[str, Any] = dict(message.attributes)
         try:
-            logger.info(
-                f"Queue {self.subscription_id} "
-                f"Received message: {message.message_id}"
+            msg = self._decode(message.data, context)
+        except Exception as e:
+            logger.error(
+                "Error decoding message {}: {}", message.message_id, e
             )
-            future = asyncio.run_coroutine_threadsafe(
-                self._process_message(message, context), self._loop
+            message.nack()
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._process_message(message, msg, context), self._loop
             )
-            # Wait for the result to confirm (ack) or reject (nack)
-            future.result(timeout=60)
-            message.ack()
         except Exception as e:
-            correlation_id.set(context.get("correlation_id", "unknown"))
-            logger.error(f"Error processing message {message.message_id}: {e}")
+            logger.error(
+                "Error scheduling message {}: {}", message.message_id, e
+            )
             message.nack()
 
     async def _process_message(
-        self, message: PubSubMessage, context: dict[Any, Any]
+        self,
+        message: PubSubMessage,
+        msg: Message[Any],
+        context: dict[str, Any],
     ) -> None:
         """
-        Internal wrapper to prepare the call to the main callback.
+        Runs the handler for a decoded message and settles the message.
 
-        This coroutine extracts attributes from the Pub/Sub message and adds
-        them to the context before calling the final processing callback.
+        The message is acked on success and nacked on failure or when
+        processing exceeds `processing_timeout`.
 
         Args:
             message: The message received from Pub/Sub.
-            context: The context dictionary to be populated.
+            msg: The decoded message envelope.
+            context: The message context, including attributes.
         """
-        context.update(dict(message.attributes))
-        logger.info(
-            f"Processing message {message.message_id} with context: {context}"
+        try:
+            async with asyncio.timeout(self.processing_timeout):
+                logger.debug(
+                    "Processing message {} with context: {}",
+                    message.message_id,
+                    context,
+                )
+                await self._dispatch(msg, context)
+            message.ack()
+            self._processed.add(message.message_id)
+        except Exception as e:
+            logger.bind(
+                correlation_id=context.get("correlation_id", "unknown")
+            ).error("Error processing message {}: {}", message.message_id, e)
+            message.nack()
+
+    def _decode(self, message: bytes, context: dict[str, Any]) -> Message[Any]:
+        """
+        Parses the message body into a standardized `Message` object.
+
+        Args:
+            message: The raw message body as bytes.
+            context: The message context, including attributes.
+
+        Returns:
+            The message envelope.
+        """
+        # orjson parses the UTF-8 bytes directly, without decoding first
+        payload_dict = orjson.loads(message)
+
+        return Message(
+            data=payload_dict.get(
+                "data", payload_dict.get("payload", payload_dict)
+            ),
+            type=payload_dict.get("type", None),
+            source=payload_dict.get(
+                "source", context.get("source", "pubsub.subscriber")
+            ),
+            correlation_id=(
+                context.get("correlation_id")
+                or payload_dict.get("correlation_id")
+            ),
         )
-        await self._callback(message.data, context)
 
-    async def _callback(self, message: bytes, context: dict[str, Any]) -> None:
+    async def _dispatch(
+        self, msg: Message[Any], context: dict[str, Any]
+    ) -> None:
         """
-        Deserializes the message and invokes the injected handler.
+        Passes a decoded message to the `IConsumerHandler`.
 
-        This is the core message processing logic. It decodes the message
-        body, constructs a standardized `Message` object, and passes it to
-        the `IConsumerHandler` for business logic execution.
+        The correlation id is bound to the logger for the duration of the
+        handler instead of being written to the request-scoped ContextVar,
+        which is only meaningful for HTTP requests.
 
         Args:
-            message: The raw message body as bytes.
+            msg: The message envelope.
             context: The message context, including attributes.
 
         Raises:
-            Exception: Propagates exceptions from the handler or from
-                deserialization errors.
+            Exception: Propagates exceptions from the handler.
         """
-        try:
-            logger.info(f"Raw message data: {str(message)}")
-            decoded_data = message.decode("utf-8")
-            payload_dict = json.loads(decoded_data)
-
-            msg = Message(
-                data=payload_dict.get(
-                    "data", payload_dict.get("payload", payload_dict)
-                ),
-                type=payload_dict.get("type", None),
-                source=payload_dict.get(
-                    "source", context.get("source", "pubsub.subscriber")
-                ),
-                correlation_id=(
-                    context.get("correlation_id")
-                    or payload_dict.get("correlation_id")
-                ),
-            )
-            correlation_id.set(msg.correlation_id)
-            await self.handler.handle_message(msg, context)
-        except Exception as e:
-            logger.error(f"Deserialization or handler error: {e}")
-            raise e
+        with logger.contextualize(correlation_id=msg.correlation_id or "N/A"):
+            try:
+                await self.handler.handle_message(msg, context)
+            except Exception as e:
+                logger.error("Handler error: {}", e)
+                raise e
@@ -0,0 +1,63 @@
+"""
+Bounded memory of recently processed messages.
+
+This module provides the `RecentMessages` class, used by consumers to
+recognize redeliveries of messages they have already processed, since
+Pub/Sub delivers messages at least once.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+
+class RecentMessages:
+    """
+    Thread-safe LRU set of message ids that expire after a TTL.
+
+    Pub/Sub invokes callbacks from several library threads, so every
+    access is guarded by a lock.
+
+    Attributes:
+        max_size: Maximum number of ids remembered.
+        ttl: Seconds an id is remembered for.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """
+        Initializes an empty set of recent messages.
+
+        Args:
+            max_size: Maximum number of ids remembered; the least recently
+                added ones are forgotten first.
+            ttl: Seconds an id is remembered for.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._expires_at: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, message_id: str) -> None:
+        """
+        Remembers a processed message.
+
+        Args:
+            message_id: The id of the message.
+        """
+        with self._lock:
+            self._expires_at[message_id] = time.monotonic() + self.ttl
+            self._expires_at.move_to_end(message_id)
+            while len(self._expires_at) > self.max_size:
+                self._expires_at.popitem(last=False)
+
+    def __contains__(self, message_id: object) -> bool:
+        """Tells whether the message was processed within the TTL."""
+        if not isinstance(message_id, str):
+            return False
+        with self._lock:
+            expires_at = self._expires_at.get(message_id)
+            if expires_at is None:
+                return False
+            if expires_at < time.monotonic():
+                del self._expires_at[message_id]
+                return False
+            return True
@@ -10,46 +10,56 @@ model.
 This is a crucial utility for setting up the database schema before running
 the application for the first time.
 
-It is important to import all SQLAlchemy models here so they are registered
-with `Base.metadata`.
+It is important to import all SQLAlchemy models in `create_tables` so they
+are registered with `Base.metadata`. They are imported there, rather than at
+module level, so that processes importing this module do not pay for them.
 
 The script can be run directly to perform the table creation.
 """
 import asyncio
 
 from loguru import logger
-from sqlalchemy import text
+from sqlalchemy import Connection, inspect, text
 
 from src.adapters.database.session import engine
 from src.domain.models.base import Base
-from src.domain.models.customer import CustomerModel  # noqa: F401
 
-# ----------------------------------------------------------------------------
-# IMPORTANT: Import your models here!
-# SQLAlchemy needs the model classes to be loaded into memory so they can be
-# registered with Base.metadata.
-#
-# Example (adjust the path according to where you defined your SQLAlchemy model):
-# from src.adapters.database.models.customer import CustomerModel
-# ----------------------------------------------------------------------------
+
+def _has_schema(conn: Connection, schema: str) -> bool:
+    """Checks whether the schema already exists."""
+    return inspect(conn).has_schema(schema)
 
 
 async def create_tables() -> None:
     """
     Creates all tables defined in models that inherit from Base.
+
+    When the schema is created by this run it cannot hold any table yet,
+    so the per-table existence probes are skipped.
     """
+    # ------------------------------------------------------------------------
+    # IMPORTANT: Import your models here!
+    # SQLAlchemy needs the model classes to be loaded into memory so they can
+    # be registered with Base.metadata.
+    # ------------------------------------------------------------------------
+    from src.domain.models.customer import CustomerModel  # noqa: F401
+
+    # Configures the mappers once, up front, instead of on first use
+    Base.registry.configure()
+
     logger.info("Starting table creation...")
 
     async with engine.begin() as conn:
-        if Base.metadata.schema:
+        checkfirst = True
+        schema = Base.metadata.schema
+        if schema:
             logger.info(
-                f"Creating schema '{Base.metadata.schema}' if it does not exist..."
-            )
-            await conn.execute(
-                text(f"CREATE SCHEMA IF NOT EXISTS {Base.metadata.schema}")
+                f"Creating schema '{schema}' if it does not exist..."
             )
+            checkfirst = await conn.run_sync(_has_schema, schema)
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
 
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, checkfirst=checkfirst)
 
     logger.info("Tables created successfully!")
     await engine.dispose()
@@ -4,22 +4,94 @@ implementation of a repository using SQLAlchemy.
 
 It manages the persistence and session lifecycle (Unit of Work).
 """
+import functools
 from abc import abstractmethod
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, TypeVar
+from typing import Any, Protocol, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Row,
+    Select,
+    bindparam,
+    delete,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.base import Base
 from src.usecases.ports.repositories_interface import IRepository
 
+
+class HasId(Protocol):
+    """Domain entity identified by a UUID primary key."""
+
+    id: UUID
+
+
+# Dialects supporting INSERT ... ON CONFLICT DO NOTHING ... RETURNING
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
 TModel = TypeVar("TModel", bound=Base)
-TDomainEntity = TypeVar("TDomainEntity")
+TDomainEntity = TypeVar("TDomainEntity", bound=HasId)
+
+
+@dataclass(frozen=True)
+class ModelStatements:
+    """
+    Statements and column lookup shared by the repositories of a model.
+
+    Attributes:
+        select_all: Selects the columns of every row of the model as plain
+            rows, which are mapped without building ORM instances.
+        delete_by_id: Deletes the row whose id is bound to the `id` param.
+        columns: The mapped columns, keyed by attribute name.
+    """
+
+    select_all: Select[Any]
+    delete_by_id: Delete
+    columns: dict[str, ColumnElement[Any]]
 
 
-class SQLAlchemyRepository[TDomainEntity, TModel: Base](
+@functools.cache
+def get_model_statements(model_class: type[Base]) -> ModelStatements:
+    """
+    Builds the statements of a model once; repositories are created per
+    Unit of Work, so building them per instance would repeat the work.
+
+    Args:
+        model_class: The SQLAlchemy model class.
+
+    Returns:
+        The statements shared by every repository of the model.
+    """
+    columns: dict[str, ColumnElement[Any]] = dict(
+        sa_inspect(model_class).columns.items()
+    )
+    return ModelStatements(
+        select_all=select(*columns.values()),
+        delete_by_id=delete(model_class).where(
+            model_class.id == bindparam("id")
+        ),
+        columns=columns,
+    )
+
+
+class SQLAlchemyRepository[TDomainEntity: HasId, TModel: Base](
     IRepository[TDomainEntity, TDomainEntity]
 ):
     """
@@ -42,6 +114,7 @@ class SQLAlchemyRepository[TDomainEntity, TModel: Base](
         """
         self.session = session
         self.model_class = model_class
+        self._statements = get_model_statements(model_class)
 
     async def __aenter__(
         self: "SQLAlchemyRepository[TDomainEntity, TModel]",
@@ -82,6 +155,17 @@ class SQLAlchemyRepository[TDomainEntity, TModel: Base](
         """Rolls back the transaction."""
         await self.session.rollback()
 
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncGenerator[None]:
+        """
+        Opens a SAVEPOINT, rolled back to if the block raises.
+
+        Yields:
+            Control to the block running inside the savepoint.
+        """
+        async with self.session.begin_nested():
+            yield
+
     async def add(self, entity: TDomainEntity) -> TDomainEntity:
         """
         Adds a new entity to the database.
@@ -97,34 +181,101 @@ class SQLAlchemyRepository[TDomainEntity, TModel: Base](
         await self.session.flush()
         return entity
 
+    async def add_many(
+        self, entities: list[TDomainEntity]
+    ) -> list[TDomainEntity]:
+        """
+        Adds several entities to the database with a bulk INSERT.
+
+        The rows are sent as plain dicts, which SQLAlchemy batches into
+        multi-row INSERT statements without building ORM instances or
+        going through the unit-of-work flush.
+
+        Args:
+            entities: The domain entities to add.
+
+        Returns:
+            The added domain entities.
+        """
+        if entities:
+            await self.session.execute(
+                insert(self.model_class),
+                [self._to_values(entity) for entity in entities],
+            )
+        return entities
+
+    async def add_if_absent(self, entity: TDomainEntity) -> bool:
+        """
+        Adds the entity unless it violates a unique constraint.
+
+        On PostgreSQL and SQLite this is a single
+        `INSERT ... ON CONFLICT DO NOTHING RETURNING id` round-trip, which
+        also closes the race between checking for and inserting a row.
+
+        Args:
+            entity: The domain entity to add.
+
+        Returns:
+            True if the entity was added, False if it conflicted with an
+            existing row.
+        """
+        dialect = self.session.get_bind().dialect.name
+        upsert = _UPSERT_INSERTS.get(dialect)
+        if upsert is None:
+            try:
+                async with self.savepoint():
+                    self.session.add(self._to_model(entity))
+                    await self.session.flush()
+                return True
+            except IntegrityError:
+                return False
+
+        stmt = (
+            upsert(self.model_class)
+            .values(**self._to_values(entity))
+            .on_conflict_do_nothing()
+            .returning(self.model_class.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar() is not None
+
     async def update(self, entity: TDomainEntity) -> TDomainEntity:
         """
-        Updates an existing entity.
+        Updates an existing entity with a single UPDATE statement.
+
+        Unlike `session.merge`, the current row is not loaded first, and
+        the updated row is read back in the same round trip via RETURNING.
 
         Args:
             entity: The domain entity to update.
 
         Returns:
-            The updated domain entity.
+            The updated domain entity as stored, or the given entity if no
+            row matched its ID.
         """
-        model = self._to_model(entity)
-        await self.session.merge(model)
-        await self.session.flush()
-        return entity
+        stmt = (
+            update(self.model_class)
+            .where(self.model_class.id == entity.id)
+            .values(**self._to_update_values(entity))
+            .returning(*self._statements.columns.values())
+        )
+        row = (await self.session.execute(stmt)).first()
+        return self._row_to_entity(row) if row else entity
 
     async def get_by_id(self, id: UUID) -> TDomainEntity | None:
         """
         Retrieves an entity by its ID.
 
+        Uses the session's primary-key lookup, which is answered from the
+        identity map without a query when the row is already loaded.
+
         Args:
             id: The ID of the entity to retrieve.
 
         Returns:
             The domain entity if found, otherwise None.
         """
-        stmt = select(self.model_class).where(self.model_class.id == id)
-        result = await self.session.execute(stmt)
-        model = result.scalars().first()
+        model = await self.session.get(self.model_class, id)
         return self._to_entity(model) if model else None
 
     async def delete(self, id: UUID) -> None:
@@ -134,40 +285,72 @@ class SQLAlchemyRepository[TDomainEntity, TModel: Base](
         Args:
             id: The ID of the entity to delete.
         """
-        stmt = delete(self.model_class).where(self.model_class.id == id)
-        await self.session.execute(stmt)
+        await self.session.execute(
+            self._statements.delete_by_id, {"id": id}
+        )
         await self.session.flush()
 
-    async def search(self, filter: dict[str, Any]) -> list[TDomainEntity]:
+    async def search(
+        self,
+        filter: dict[str, Any],
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[TDomainEntity]:
         """
         Searches for entities based on a filter.
 
         Args:
             filter: A dictionary of filters to apply.
+            limit: Maximum number of entities to return (all if None).
+            offset: Number of matching entities to skip.
 
         Returns:
             A list of domain entities that match the filter.
         """
-        stmt = select(self.model_class)
-        for key, value in filter.items():
-            if hasattr(self.model_class, key):
-                stmt = stmt.where(getattr(self.model_class, key) == value)
+        columns = self._statements.columns
+        # A single where() clones the statement once, not once per filter
+        stmt = self._statements.select_all.where(
+            *(columns[k] == v for k, v in filter.items() if k in columns)
+        )
 
-        result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return await self._fetch(stmt, limit, offset)
 
-    async def list_all(self) -> list[TDomainEntity]:
+    async def list_all(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[TDomainEntity]:
         """
         Retrieves all entities.
 
+        Args:
+            limit: Maximum number of entities to return (all if None).
+            offset: Number of entities to skip.
+
         Returns:
             A list of all domain entities.
         """
-        stmt = select(self.model_class)
+        return await self._fetch(self._statements.select_all, limit, offset)
+
+    async def _fetch(
+        self, stmt: Select[Any], limit: int | None, offset: int
+    ) -> list[TDomainEntity]:
+        """
+        Executes a select, applying the pagination, and maps the rows.
+
+        Args:
+            stmt: The select statement.
+            limit: Maximum number of rows to return (all if None).
+            offset: Number of rows to skip.
+
+        Returns:
+            The mapped domain entities.
+        """
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
-        return [self._to_entity(m) for m in models]
+        return [self._row_to_entity(row) for row in result]
 
     @abstractmethod
     def _to_model(self, entity: TDomainEntity) -> TModel:
@@ -182,6 +365,50 @@ class SQLAlchemyRepository[TDomainEntity, TModel: Base](
         """
         ...
 
+    @abstractmethod
+    def _to_values(self, entity: TDomainEntity) -> dict[str, Any]:
+        """
+        Maps a domain entity to the column values of its row.
+
+        Used by the Core inserts, so no ORM instance is built.
+
+        Args:
+            entity: The domain entity.
+
+        Returns:
+            The values of the columns to insert.
+        """
+        ...
+
+    @abstractmethod
+    def _to_update_values(self, entity: TDomainEntity) -> dict[str, Any]:
+        """
+        Maps a domain entity to the column values written by `update`.
+
+        Args:
+            entity: The domain entity to map.
+
+        Returns:
+            The values to set, keyed by column name.
+        """
+        ...
+
+    @abstractmethod
+    def _row_to_entity(self, row: Row[Any]) -> TDomainEntity:
+        """
+        Maps a plain row of the model's columns to a domain entity.
+
+        Used by the list queries, which skip the ORM identity map and
+        instance state for rows that are only read.
+
+        Args:
+            row: The row, with one attribute per mapped column.
+
+        Returns:
+            The domain entity.
+        """
+        ...
+
     @abstractmethod
     def _to_entity(self, model: TModel) -> TDomainEntity:
         """
@@ -5,7 +5,9 @@ This module provides a concrete implementation of the `IDBCustomerRepository`
 interface using SQLAlchemy for data persistence. It handles the mapping
 between the `Customer` domain entity and the `CustomerModel` ORM model.
 """
-from sqlalchemy import select, update
+from typing import Any
+
+from sqlalchemy import Row, bindparam, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.database.repositories.base_repository import (
@@ -18,6 +20,13 @@ from src.usecases.v1.customers.ports.customer_repositories import (
     IDBCustomerRepository,
 )
 
+# Built once; the email is bound at execution time
+_EMAIL_EXISTS = (
+    select(literal(1))
+    .where(CustomerModel.email == bindparam("email"))
+    .limit(1)
+)
+
 
 class SQLAlchemyCustomerRepository(
     SQLAlchemyRepository[Customer, CustomerModel], IDBCustomerRepository
@@ -40,28 +49,6 @@ class SQLAlchemyCustomerRepository(
         """
         super().__init__(session, CustomerModel)
 
-    async def update(self, entity: Customer) -> Customer:
-        """
-        Updates an existing customer in the database.
-
-        Args:
-            entity: The `Customer` entity with updated data.
-
-        Returns:
-            The updated `Customer` entity.
-        """
-        stmt = (
-            update(self.model_class)
-            .where(self.model_class.id == entity.id)
-            .values(
-                name=entity.name,
-                email=entity.email.value,
-                updated_at=entity.updated_at,
-            )
-        )
-        await self.session.execute(stmt)
-        return entity
-
     async def exists_by_email(self, email: str) -> bool:
         """
         Checks if a customer with the given email already exists.
@@ -72,9 +59,9 @@ class SQLAlchemyCustomerRepository(
         Returns:
             True if a customer with the email exists, False otherwise.
         """
-        stmt = select(self.model_class).where(self.model_class.email == email)
-        result = await self.session.execute(stmt)
-        return result.scalars().first() is not None
+        # A single probe of the unique email index; no entity is loaded
+        found = await self.session.scalar(_EMAIL_EXISTS, {"email": email})
+        return found is not None
 
     def _to_model(self, entity: Customer) -> CustomerModel:
         """
@@ -94,6 +81,60 @@ class SQLAlchemyCustomerRepository(
             updated_at=entity.updated_at,
         )
 
+    def _to_values(self, entity: Customer) -> dict[str, Any]:
+        """
+        Maps a `Customer` domain entity to the columns of its row.
+
+        Args:
+            entity: The `Customer` domain entity.
+
+        Returns:
+            The values of the columns to insert.
+        """
+        return {
+            "id": entity.id,
+            "name": entity.name,
+            "email": entity.email.value,
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        }
+
+    def _to_update_values(self, entity: Customer) -> dict[str, Any]:
+        """
+        Maps a `Customer` domain entity to the columns it may update.
+
+        `updated_at` is left out so the column's `onupdate` stamps it with
+        the database clock; `update` reads the stored value back.
+
+        Args:
+            entity: The `Customer` domain entity.
+
+        Returns:
+            The values of the updatable columns.
+        """
+        return {
+            "name": entity.name,
+            "email": entity.email.value,
+        }
+
+    def _row_to_entity(self, row: Row[Any]) -> Customer:
+        """
+        Converts a row of `CustomerModel` columns to a `Customer` entity.
+
+        Args:
+            row: The row read from the customers table.
+
+        Returns:
+            The corresponding `Customer` domain entity.
+        """
+        return Customer(
+            row.id,
+            row.name,
+            Email.from_trusted(row.email),
+            row.created_at,
+            row.updated_at,
+        )
+
     def _to_entity(self, model: CustomerModel) -> Customer:
         """
         Converts a `CustomerModel` ORM object to a `Customer` domain entity.
@@ -107,7 +148,7 @@ class SQLAlchemyCustomerRepository(
         return Customer(
             id=model.id,
             name=model.name,
-            email=Email(model.email),
+            email=Email.from_trusted(model.email),
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
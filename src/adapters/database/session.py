@@ -7,9 +7,14 @@ session factory, and provides a dependency injection utility (`get_session`)
 to supply sessions to other parts of the application, such as Unit of Work
 implementations or FastAPI dependencies.
 """
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from loguru import logger
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -17,10 +22,50 @@ from sqlalchemy.ext.asyncio import (
 
 from src.config.settings import settings
 
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """
+    Returns the driver-specific engine options.
+
+    For PostgreSQL, `create_async_engine` already uses
+    `AsyncAdaptedQueuePool`; only its sizing is set here. Connections are
+    recycled before idle timeouts on the server or proxies close them.
+
+    With asyncpg, both the driver and the SQLAlchemy dialect keep a cache
+    of prepared statements per connection, so repeated queries skip the
+    parse/plan step and use the binary protocol.
+
+    Args:
+        database_url: The database connection string.
+
+    Returns:
+        Keyword arguments for `create_async_engine`.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return {}
+
+    options: dict[str, Any] = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE_SECONDS,
+    }
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": (
+                settings.DATABASE_STATEMENT_CACHE_SIZE
+            ),
+        }
+    return options
+
+
 # 1. Create an asynchronous engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.ECHO_SQL,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    **_engine_options(settings.DATABASE_URL),
 )
 
 # 2. Configure the session factory
@@ -32,6 +77,29 @@ async_session_factory = async_sessionmaker(
 )
 
 
+async def warm_up_pool(size: int = settings.DATABASE_POOL_SIZE) -> None:
+    """
+    Opens pool connections ahead of the first requests.
+
+    The connections are opened concurrently and returned to the pool, so
+    the first requests do not pay for the TCP handshake and authentication.
+    Failures are only logged: the readiness probe reports an unavailable
+    database.
+
+    Args:
+        size: How many connections to open.
+    """
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    connections = [r for r in results if isinstance(r, AsyncConnection)]
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+    failed = len(results) - len(connections)
+    if failed:
+        logger.warning("Failed to open {} pooled connections", failed)
+
+
 # 3. Dependency Injection (for use in UnitOfWork or FastAPI)
 async def get_session() -> AsyncGenerator[AsyncSession]:
     """
@@ -3,26 +3,37 @@ This module defines the abstract base class for message publishers.
 
 It standardizes the message format (Envelope) and serialization.
 """
-import json
-import uuid
+import os
+import random
 from abc import ABC, abstractmethod
-from dataclasses import asdict
-from datetime import datetime
-from typing import Any, TypeVar
-from uuid import UUID
+from typing import TypeVar
+
+import orjson
 
 from src.domain.entities.message import Message
 
 T = TypeVar("T")
 
+# Correlation IDs only link log lines and messages together; they are not
+# secrets, so a seeded PRNG is used instead of a UUID from os.urandom
+_RNG = random.Random(os.urandom(16))
+if hasattr(os, "register_at_fork"):
+    # Forked workers would otherwise draw the same sequence
+    os.register_at_fork(after_in_child=lambda: _RNG.seed(os.urandom(16)))
+
 
 class BasePublisher[T](ABC):
     """
     Abstract base class for publishing messages.
 
     Standardizes the message format (Envelope) and serialization.
+
+    Attributes:
+        SOURCE: The CloudEvents source of every published message.
     """
 
+    SOURCE = "/v1/app-customers"
+
     def _get_correlation_id(self) -> str:
         """
         Hook to get the correlation_id (can be overridden).
@@ -30,11 +41,11 @@ class BasePublisher[T](ABC):
         Returns:
             A new correlation ID.
         """
-        return str(uuid.uuid4())
+        return _RNG.randbytes(16).hex()
 
     @abstractmethod
     async def send_message(
-        self, destination: str, body: str, attributes: dict[str, str]
+        self, destination: str, body: bytes, attributes: dict[str, str]
     ) -> None:
         """
         Abstract method that must be implemented by the concrete adapter.
@@ -43,7 +54,7 @@ class BasePublisher[T](ABC):
 
         Args:
             destination: The message destination (queue, topic, routing key).
-            body: The message content already serialized in JSON.
+            body: The message content already serialized in UTF-8 JSON.
             attributes: Transport metadata (headers).
         """
         ...
@@ -71,7 +82,7 @@ class BasePublisher[T](ABC):
         message = Message(
             data=payload,
             type=event_type,
-            source="/v1/app-customers",
+            source=self.SOURCE,
             correlation_id=cid,
         )
 
@@ -79,30 +90,14 @@ class BasePublisher[T](ABC):
         attributes = {
             "correlation_id": cid,
             "ce-type": event_type,
-            "ce-source": message.source,
+            "ce-source": self.SOURCE,
             "ce-id": message.id,
         }
 
-        # 3. Serialize to JSON (Structured Mode)
-        body = json.dumps(asdict(message), default=self._json_serializer)
+        # 3. Serialize to JSON (Structured Mode). orjson walks dataclasses,
+        # datetime and UUID natively, so the envelope is not first copied
+        # into dicts; anything else falls back to its string form
+        body = orjson.dumps(message, default=str)
 
         # 4. Send with attributes
         await self.send_message(destination, body, attributes)
-
-    @staticmethod
-    def _json_serializer(obj: Any) -> Any:
-        """
-        Helper for serializing common types not natively supported by
-        json.dumps.
-
-        Args:
-            obj: The object to serialize.
-
-        Returns:
-            A serializable representation of the object.
-        """
-        if isinstance(obj, (datetime,)):
-            return obj.isoformat()
-        if isinstance(obj, (UUID,)):
-            return str(obj)
-        return str(obj)
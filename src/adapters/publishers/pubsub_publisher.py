@@ -6,8 +6,6 @@ It manages the bridge between the synchronous Google library and the
 asynchronous event loop.
 """
 import asyncio
-import uuid
-from concurrent.futures import Future
 from typing import Any
 
 from asgi_correlation_id import correlation_id
@@ -28,6 +26,10 @@ class PubSubPublisher(BasePublisher[Any]):
 
     Manages the bridge between the synchronous Google library and the
     asynchronous event loop.
+
+    Batching is left to the injected client: when it is built with
+    `BatchSettings`, concurrent publishes share a single Publish RPC and
+    each `send_message` call only awaits the result of its own message.
     """
 
     def __init__(
@@ -45,6 +47,7 @@ class PubSubPublisher(BasePublisher[Any]):
         self.pubsub_client = pubsub_client
         self.project_id = project_id
         self.publish_timeout = 10.0
+        self._topic_paths: dict[str, str] = {}
 
     def _get_correlation_id(self) -> str:
         """
@@ -53,54 +56,53 @@ class PubSubPublisher(BasePublisher[Any]):
         Returns:
             The correlation ID.
         """
-        return correlation_id.get() or str(uuid.uuid4())
+        return correlation_id.get() or super()._get_correlation_id()
+
+    def _resolve_topic_path(self, destination: str) -> str:
+        """
+        Resolves a destination to the full path of its topic.
+
+        Args:
+            destination: A topic ID or an already full topic path.
+
+        Returns:
+            The full topic path.
+        """
+        # Checks if the destination is a full path or just the ID
+        if "/" in destination:
+            return destination
+        topic_path: str = self.pubsub_client.topic_path(
+            self.project_id, destination
+        )
+        return topic_path
 
     async def send_message(
-        self, destination: str, body: str, attributes: dict[str, str]
+        self, destination: str, body: bytes, attributes: dict[str, str]
     ) -> None:
         """
         Sends the message to the Pub/Sub topic and waits for confirmation.
 
         Args:
             destination: The destination topic.
-            body: The message body.
+            body: The message body, as UTF-8 encoded JSON.
             attributes: The message attributes.
         """
-        # Checks if the destination is a full path or just the ID
-        if "/" in destination:
-            topic_path = destination
-        else:
-            topic_path = self.pubsub_client.topic_path(
-                self.project_id, destination
-            )
+        topic_path = self._topic_paths.get(destination)
+        if topic_path is None:
+            topic_path = self._resolve_topic_path(destination)
+            self._topic_paths[destination] = topic_path
 
-        loop = asyncio.get_running_loop()
-        aio_future = loop.create_future()
-
-        def callback(pubsub_future: Future[str]) -> None:
-            """
-            Callback to bridge the Pub/Sub future with the asyncio future.
-
-            Args:
-                pubsub_future: The future from the Pub/Sub library.
-            """
-            try:
-                result = pubsub_future.result()
-                loop.call_soon_threadsafe(aio_future.set_result, result)
-            except Exception as e:
-                loop.call_soon_threadsafe(aio_future.set_exception, e)
-
-        # Publishes the message to Pub/Sub
+        # Publishes the message to Pub/Sub. The library resolves its future
+        # on a background thread; wrap_future bridges it to the event loop
         publish_future = self.pubsub_client.publish(
-            topic_path, body.encode("utf-8"), **attributes
+            topic_path, body, **attributes
         )
-        publish_future.add_done_callback(callback)
+        aio_future = asyncio.wrap_future(publish_future)
 
         try:
-            msg_id = await asyncio.wait_for(
-                aio_future, timeout=self.publish_timeout
-            )
-            logger.info(f"Published message ID: {msg_id} to {destination}")
+            async with asyncio.timeout(self.publish_timeout):
+                msg_id = await aio_future
+            logger.debug("Published message ID: {} to {}", msg_id, destination)
         except TimeoutError:
             error_msg = (
                 f"Timeout publishing to {destination} "
@@ -6,9 +6,11 @@ formatting across all libraries (e.g., Uvicorn, SQLAlchemy). It also
 injects a correlation ID into the logs if available.
 """
 import logging
+import queue
 import sys
-from types import FrameType
-from typing import TYPE_CHECKING
+import threading
+from types import CodeType, FrameType
+from typing import TYPE_CHECKING, TextIO
 
 from asgi_correlation_id import correlation_id
 from loguru import logger
@@ -19,6 +21,99 @@ if TYPE_CHECKING:
 
 from src.config.settings import settings
 
+# Whether frames of a code object belong to the logging machinery, cached
+# per code object so each call site is only inspected once
+_SKIPPED_CODE: dict[CodeType, bool] = {}
+
+
+def _is_skipped(frame: FrameType) -> bool:
+    """
+    Tells whether a frame belongs to `logging` or to this module.
+
+    Args:
+        frame: The frame to check.
+
+    Returns:
+        True if the frame should be skipped when looking for the caller.
+    """
+    code = frame.f_code
+    skipped = _SKIPPED_CODE.get(code)
+    if skipped is None:
+        filename = code.co_filename
+        module_name = frame.f_globals.get("__name__", "")
+        skipped = (
+            filename == logging.__file__
+            or module_name == "logging"
+            or module_name.startswith("logging.")
+            or filename == __file__
+        )
+        _SKIPPED_CODE[code] = skipped
+    return skipped
+
+
+class BatchedStreamWriter:
+    """
+    File-like Loguru sink that writes to a stream from a background thread.
+
+    Formatted messages are put on an in-process queue, so logging threads
+    neither pickle records (as `enqueue=True` does) nor wait on the
+    stream. The writer thread drains up to `max_batch` messages per wakeup
+    and writes them with a single `write` and `flush`.
+
+    Attributes:
+        stream: The stream messages are written to.
+        max_batch: Maximum number of messages written at once.
+    """
+
+    def __init__(self, stream: TextIO, max_batch: int = 256):
+        """
+        Initializes the writer and starts its thread.
+
+        Args:
+            stream: The stream messages are written to.
+            max_batch: Maximum number of messages written at once.
+        """
+        self.stream = stream
+        self.max_batch = max_batch
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._drain, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """
+        Queues a formatted message for writing.
+
+        Args:
+            message: The formatted log message.
+        """
+        self._queue.put(message)
+
+    def stop(self) -> None:
+        """Writes the pending messages and stops the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        """Writes queued messages in batches until stopped."""
+        while True:
+            batch: list[str] = []
+            message = self._queue.get()
+            while message is not None:
+                batch.append(message)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    message = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self.stream.write("".join(batch))
+                self.stream.flush()
+            if message is None:
+                return
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -26,8 +121,17 @@ class InterceptHandler(logging.Handler):
     redirects them to `loguru`.
     This ensures that logs from libraries
     (like Uvicorn, SQLAlchemy) are formatted consistently.
+
+    Attributes:
+        levels: Loguru level names by standard level name, resolved once
+            by `configure_logging`.
+        threshold: Level number below which records are dropped, set by
+            `configure_logging`.
     """
 
+    levels: dict[str, str] = {}
+    threshold: int = logging.NOTSET
+
     def emit(self, record: logging.LogRecord) -> None:
         """
         Emits a log record.
@@ -35,35 +139,25 @@ class InterceptHandler(logging.Handler):
         Args:
             record: The log record to emit.
         """
-        # Tries to get the corresponding level in Loguru
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = str(record.levelno)
+        # Loggers with their own lower level still reach this handler; drop
+        # their records before any frame or Loguru work
+        if record.levelno < self.threshold:
+            return
+
+        # Uses the corresponding Loguru level, or the level number for
+        # levels Loguru does not know
+        level: str | int = self.levels.get(record.levelname, record.levelno)
 
         # Finds the origin of the call to maintain the correct stack trace
         frame: FrameType | None = logging.currentframe()
-        depth = 2
-        while frame:
-            filename = frame.f_code.co_filename
-            module_name = frame.f_globals.get("__name__", "")
-
-            is_logging = (
-                filename == logging.__file__
-                or module_name == "logging"
-                or module_name.startswith("logging.")
-            )
-            is_this_file = filename == __file__
-
-            if is_logging or is_this_file:
-                frame = frame.f_back
-                depth += 1
-            else:
-                break
-
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level, record.getMessage()
-        )
+        depth = 0
+        while frame and _is_skipped(frame):
+            frame = frame.f_back
+            depth += 1
+
+        # Only %-formats the message when there are arguments
+        message = record.getMessage() if record.args else str(record.msg)
+        logger.opt(depth=depth, exception=record.exc_info).log(level, message)
 
 
 def configure_logging() -> None:
@@ -77,31 +171,49 @@ def configure_logging() -> None:
     # Removes default Loguru handlers
     logger.remove()
 
+    # Resolves the Loguru levels matching the standard ones once
+    InterceptHandler.levels = {
+        name: logger.level(name).name
+        for name in logging.getLevelNamesMapping()
+        if name not in ("NOTSET", "WARN", "FATAL")
+    }
+
+    InterceptHandler.threshold = logging.getLevelNamesMapping()[log_level]
+
     # Intercepts logs from the root and sets the level
     logging.root.handlers = [InterceptHandler()]
     logging.root.setLevel(log_level)
 
     # Removes handlers from existing loggers to avoid duplication
-    # and ensures they propagate to the root (which is intercepted)
-    for name in logging.root.manager.loggerDict.keys():
-        logging.getLogger(name).handlers = []
-        logging.getLogger(name).propagate = True
-
-    # Filter to inject Correlation ID (if available)
-    def correlation_id_filter(record: "Record") -> bool:
+    # and ensures they propagate to the root (which is intercepted).
+    # Placeholders are skipped rather than turned into loggers; loggers
+    # created later already start without handlers and propagating
+    for existing in list(logging.root.manager.loggerDict.values()):
+        if isinstance(existing, logging.Logger):
+            existing.handlers = []
+            existing.propagate = True
+
+    # Patcher to inject Correlation ID (if available). Patchers run once
+    # per record on the logging thread, where the request's ContextVar is
+    # set, instead of once per sink like a filter
+    def add_correlation_id(record: "Record") -> None:
         """
-        Filter to inject the correlation ID into the log record.
+        Injects the correlation ID into the log record.
+
+        A correlation ID already bound to the record, e.g. by consumers
+        through `logger.contextualize`, takes precedence over the one of
+        the current HTTP request.
 
         Args:
             record: The log record.
-
-        Returns:
-            True if the record should be logged, False otherwise.
         """
-        cid = correlation_id.get()
-        record["extra"]["correlation_id"] = cid if cid else "N/A"
-        return True
+        extra = record["extra"]
+        if "correlation_id" not in extra:
+            extra["correlation_id"] = correlation_id.get() or "N/A"
+
+    logger.configure(patcher=add_correlation_id)
 
+    debug = log_level == "DEBUG"
     log_format = (
         "<level>{level: <8}</level> | "
         "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
@@ -111,11 +223,12 @@ def configure_logging() -> None:
     )
 
     logger.add(
-        sys.stderr,
+        BatchedStreamWriter(sys.stderr),
         level=log_level,
         format=log_format,
-        filter=correlation_id_filter,
-        enqueue=True,
-        backtrace=True,
-        diagnose=True,
+        colorize=sys.stderr.isatty(),
+        # Extended tracebacks with variable values are costly to build and
+        # only worth it when debugging
+        backtrace=debug,
+        diagnose=debug,
     )
@@ -7,10 +7,14 @@ consumer manager.
 """
 import asyncio
 import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
 
 from google.cloud.pubsub_v1 import SubscriberClient
 
 from src.adapters.consumers.consumer_manager import ConsumerManager
+from src.adapters.consumers.handlers.batching_handler import BatchingHandler
 from src.adapters.consumers.handlers.create_customer_handler import (
     CreateCustomerHandler,
 )
@@ -20,11 +24,48 @@ from src.adapters.consumers.pubsub_consumers.pubsub_consumer import (
 from src.config.settings import settings
 from src.di.v1.get_create_customer_uc import (
     get_create_customer_uc,
+    get_create_customers_batch_uc,
     get_customer_uow_factory,
 )
+from src.domain.entities.message import Message
+from src.usecases.ports.consumer_handler_interface import IConsumerHandler
 
 
-@functools.lru_cache
+@dataclass(frozen=True, slots=True)
+class ConsumerSpec:
+    """
+    Declares a consumer: the subscription it listens to and its handler.
+
+    Attributes:
+        subscription_id: The ID of the Pub/Sub subscription.
+        handler_factory: Builds the handler processing its messages.
+    """
+
+    subscription_id: str
+    handler_factory: Callable[[], IConsumerHandler[Message[Any]]]
+
+
+def _create_customer_handler() -> IConsumerHandler[Message[Any]]:
+    """Builds the batching handler for customer creation messages."""
+    return BatchingHandler(
+        CreateCustomerHandler(
+            uow_factory=get_customer_uow_factory,
+            usecase_factory=get_create_customer_uc,
+            batch_usecase_factory=get_create_customers_batch_uc,
+        )
+    )
+
+
+# Every consumer run by the worker; adding one only takes a new entry
+CONSUMER_SPECS: tuple[ConsumerSpec, ...] = (
+    ConsumerSpec(
+        subscription_id=settings.CUSTOMER_CREATE_TOPIC_SUBSCRIPTION,
+        handler_factory=_create_customer_handler,
+    ),
+)
+
+
+@functools.cache
 def get_subscriber_client() -> SubscriberClient:
     """
     Returns a singleton instance of the Pub/Sub SubscriberClient.
@@ -45,29 +86,34 @@ async def get_consumer_manager() -> ConsumerManager:
 
     This function should be called during application startup to ensure that
     the correct event loop is captured and used by the consumers. It
-    instantiates each consumer with its specific handler and dependencies.
+    instantiates a consumer for each entry of `CONSUMER_SPECS`, sharing the
+    subscriber client and the loop between them.
+
+    It must be awaited from the loop that will run the consumers (e.g. the
+    worker's `main`): messages are dispatched to that loop, so a loop that
+    nothing drives would stall them silently.
 
     Returns:
         A `ConsumerManager` instance containing all configured consumers.
+
+    Raises:
+        RuntimeError: If no event loop is running.
     """
     client = get_subscriber_client()
 
-    # Ensure we use the currently running event loop (e.g., from Uvicorn)
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.get_event_loop()
+    # Ensure we use the currently running event loop (uvloop in the worker)
+    loop = asyncio.get_running_loop()
 
-    # Consumer 1: Handles customer creation messages
-    create_customer_consumer = PubSubConsumer(
-        subscription_id=settings.CUSTOMER_CREATE_TOPIC_SUBSCRIPTION,
-        handler=CreateCustomerHandler(
-            uow_factory=get_customer_uow_factory,
-            usecase_factory=get_create_customer_uc,
-        ),
-        project_id=settings.PUBSUB_PROJECT_ID,
-        client=client,
-        loop=loop,
+    project_id = settings.PUBSUB_PROJECT_ID
+    return ConsumerManager(
+        consumers=[
+            PubSubConsumer(
+                subscription_id=spec.subscription_id,
+                handler=spec.handler_factory(),
+                project_id=project_id,
+                client=client,
+                loop=loop,
+            )
+            for spec in CONSUMER_SPECS
+        ]
     )
-
-    return ConsumerManager(consumers=[create_customer_consumer])
@@ -8,16 +8,19 @@ It follows a layered approach, defining:
 3.  Factories for domain services.
 4.  Factories for the use cases themselves.
 
-It leverages `functools.lru_cache` to create singleton clients and FastAPI's
+It leverages `functools.cache` to create singleton clients and FastAPI's
 `Depends` for managing the lifecycle of resources like database sessions and
 cache connections.
 """
+import asyncio
 import functools
 from collections.abc import AsyncGenerator
 
 import redis.asyncio as redis
 from fastapi import Depends
 from google.cloud.pubsub_v1 import PublisherClient
+from google.cloud.pubsub_v1.types import BatchSettings
+from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.adapters.cache.redis_cache import RedisCache
@@ -31,6 +34,7 @@ from src.adapters.publishers.customer_message_adapter import (
 from src.config.settings import settings
 from src.domain.services.customer_service import CustomerRegistrationService
 from src.usecases.v1.customers.create_customer import (
+    CustomerBatchCreateUseCase,
     CustomerCreateUseCase,
     InitiateCustomerCreation,
 )
@@ -42,20 +46,67 @@ from src.usecases.v1.customers.ports.customer_repositories import (
 # --- 1. Infrastructure Providers (Singletons) ---
 
 
-@functools.lru_cache
+@functools.cache
 def get_redis_client() -> redis.Redis:
-    """Returns a singleton instance of the Redis client."""
-    return redis.Redis(
+    """
+    Returns a singleton instance of the Redis client.
+
+    Responses are decoded to `str` by the client, as the cache stores text.
+    The pool is bounded: when all its connections are busy, commands wait
+    up to `REDIS_POOL_TIMEOUT_SECONDS` for one instead of opening more.
+    """
+    pool = redis.BlockingConnectionPool(
         host=settings.REDIS_HOST,
         port=settings.REDIS_PORT,
         db=settings.REDIS_DB,
+        decode_responses=True,
+        max_connections=settings.REDIS_POOL_SIZE,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_keepalive=True,
     )
+    # The client owns the pool, so closing the client disconnects it
+    return redis.Redis.from_pool(pool)
 
 
-@functools.lru_cache
-async def get_pubsub_client() -> PublisherClient:
-    """Returns a singleton instance of the PubSub client."""
-    return PublisherClient()
+async def warm_up_redis_pool(size: int = settings.REDIS_POOL_SIZE) -> None:
+    """
+    Opens Redis pool connections ahead of the first requests.
+
+    Concurrent PINGs each take a connection from the pool, so the first
+    requests do not pay for the TCP handshake. Failures are only logged:
+    the readiness probe reports an unavailable Redis.
+
+    Args:
+        size: How many connections to open.
+    """
+    client = get_redis_client()
+
+    async def ping() -> None:
+        await client.ping()  # type: ignore[misc]
+
+    results = await asyncio.gather(
+        *(ping() for _ in range(size)), return_exceptions=True
+    )
+    failed = sum(isinstance(r, BaseException) for r in results)
+    if failed:
+        logger.warning("Failed to open {} Redis connections", failed)
+
+
+@functools.cache
+def get_pubsub_client() -> PublisherClient:
+    """
+    Returns a singleton instance of the PubSub client.
+
+    Each request publishes a single message, so the batch latency bounds
+    how long the HTTP call waits before the message is actually sent.
+    """
+    return PublisherClient(
+        batch_settings=BatchSettings(
+            max_messages=settings.PUBSUB_BATCH_MAX_MESSAGES,
+            max_bytes=settings.PUBSUB_BATCH_MAX_BYTES,
+            max_latency=settings.PUBSUB_BATCH_MAX_LATENCY,
+        )
+    )
 
 
 # --- 2. Adapters Factories ---
@@ -67,8 +118,14 @@ class CustomerRedisCache(RedisCache, ICustomerControlCache):
     pass
 
 
+@functools.cache
 def get_redis_cache() -> CustomerRedisCache:
-    """Returns a customer-specific Redis cache."""
+    """
+    Returns a singleton customer-specific Redis cache.
+
+    Its transactions are scoped to the current task, so a shared instance
+    serves concurrent requests and reuses their idle pipelines.
+    """
     return CustomerRedisCache(client=get_redis_client())
 
 
@@ -87,10 +144,15 @@ def get_customer_repository(
     return SQLAlchemyCustomerRepository(session=session)
 
 
-async def get_message_publisher() -> CustomerMessageAdapter:
-    """Returns a message publisher."""
-    pubsub_client = await get_pubsub_client()
-    return CustomerMessageAdapter(pubsub_client=pubsub_client)
+@functools.cache
+def get_message_publisher() -> CustomerMessageAdapter:
+    """
+    Returns a singleton message publisher.
+
+    Publishes are batched by the shared client, and a single publisher also
+    keeps its resolved topic paths across requests.
+    """
+    return CustomerMessageAdapter(pubsub_client=get_pubsub_client())
 
 
 # --- 3. Domain Services Factories ---
@@ -145,7 +207,7 @@ async def get_initiate_customer_creation_uc(
     Returns:
         An instance of the InitiateCustomerCreation use case.
     """
-    publisher = await get_message_publisher()
+    publisher = get_message_publisher()
     return InitiateCustomerCreation(
         cache=cache,
         publisher=publisher,
@@ -169,6 +231,21 @@ def get_create_customer_uc(
     return CustomerCreateUseCase(repository=uow)
 
 
+def get_create_customers_batch_uc(
+    uow: IDBCustomerRepository,
+) -> CustomerBatchCreateUseCase:
+    """
+    Returns the use case that persists several customers at once.
+
+    Args:
+        uow: The unit of work.
+
+    Returns:
+        An instance of the CustomerBatchCreateUseCase.
+    """
+    return CustomerBatchCreateUseCase(repository=uow)
+
+
 def get_customer_uow_factory() -> IDBCustomerRepository:
     """Factory to create the Unit of Work (Repository)."""
     return get_customer_repository(async_session_factory())
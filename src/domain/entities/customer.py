@@ -3,7 +3,7 @@ This module defines the `Customer` entity, which represents a customer with
 a unique identity and mutable state. It also defines a
 `CustomerCreateMessage` for creating customers.
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
@@ -11,15 +11,17 @@ from src.domain.entities.message import Message
 from src.domain.value_objects.email import Email
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Customer:
     """Entity with a unique and mutable identity."""
 
     id: UUID
     name: str
     email: Email
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    # Evaluated per instance; a plain default would be frozen at import.
+    # Naive, like the TIMESTAMP WITHOUT TIME ZONE columns they are stored in
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
     def change_email(self, new_email_str: str) -> None:
         """Changes email — creates a new Value Object with validation."""
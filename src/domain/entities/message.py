@@ -5,15 +5,48 @@ CloudEvents v1.0 specification (Structured Content Mode).
 This class serves as a standardized envelope for all messages within the
 system, ensuring interoperability and consistent metadata.
 """
-import uuid
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TypeVar
 
+from src.domain.ids import random_id
+
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+def _new_id() -> str:
+    """
+    Generates a random 128-bit message id.
+
+    Returns:
+        The id as 32 hexadecimal characters.
+    """
+    return random_id().hex()
+
+
+# The event time has a one-second granularity, so its ISO string is only
+# formatted once per second and shared by the messages created meanwhile
+_last_time: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Returns the current UTC time, truncated to the second, in ISO format.
+
+    Returns:
+        The ISO 8601 timestamp.
+    """
+    global _last_time
+    second = int(time.time())
+    cached_second, iso = _last_time
+    if second != cached_second:
+        iso = datetime.fromtimestamp(second, UTC).isoformat()
+        _last_time = (second, iso)
+    return iso
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class Message[T]:
     """
     A generic message class compatible with the CloudEvents v1.0
@@ -28,7 +61,7 @@ class Message[T]:
         source: The source of the event.
         id: A unique identifier for the event.
         specversion: The version of the CloudEvents specification.
-        time: The time the event was generated.
+        time: The time the event was generated, to the second.
         datacontenttype: The content type of the `data` attribute.
         correlation_id: An optional identifier for tracking related events.
     """
@@ -36,8 +69,8 @@ class Message[T]:
     data: T
     type: str
     source: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     specversion: str = "1.0"
-    time: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    time: str = field(default_factory=_now_iso)
     datacontenttype: str = "application/json"
     correlation_id: str | None = None
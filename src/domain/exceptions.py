@@ -16,4 +16,11 @@ class CustomerAlreadyExistsError(DomainError):
     """Raised when trying to register a customer that already exists."""
 
     def __init__(self, email: str):
-        super().__init__(f"Customer with email '{email}' already exists.")
+        # Only the email is kept; the message is formatted when displayed,
+        # and copies rebuild the error from its args
+        self.email = email
+        super().__init__(email)
+
+    def __str__(self) -> str:
+        """Returns the error message."""
+        return f"Customer with email '{self.email}' already exists."
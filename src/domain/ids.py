@@ -0,0 +1,49 @@
+"""
+This module generates the random identifiers used by the domain.
+
+Random bytes are read from the OS in blocks, one block per thread, so
+generating an id does not cost a system call each time.
+"""
+import os
+import threading
+from uuid import UUID
+
+_ID_SIZE = 16
+_ID_BLOCK_SIZE = _ID_SIZE * 1024
+_ids = threading.local()
+
+
+def _discard_ids() -> None:
+    """Drops the inherited blocks so a forked child never reuses ids."""
+    global _ids
+    _ids = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_ids)
+
+
+def random_id() -> bytes:
+    """
+    Returns 128 random bits taken from the current thread's block.
+
+    Returns:
+        16 random bytes.
+    """
+    block: bytes | None = getattr(_ids, "block", None)
+    position: int = getattr(_ids, "position", 0)
+    if block is None or position >= len(block):
+        block = _ids.block = os.urandom(_ID_BLOCK_SIZE)
+        position = 0
+    _ids.position = position + _ID_SIZE
+    return block[position : position + _ID_SIZE]
+
+
+def new_uuid() -> UUID:
+    """
+    Generates a random (version 4) UUID.
+
+    Returns:
+        The new UUID.
+    """
+    return UUID(bytes=random_id(), version=4)
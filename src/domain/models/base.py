@@ -28,7 +28,10 @@ class Base(AsyncAttrs, DeclarativeBase):
         DateTime, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now(), nullable=False
+        DateTime,
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
     metadata = MetaData(schema=settings.DATABASE_SCHEMA)
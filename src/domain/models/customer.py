@@ -30,7 +30,7 @@ class CustomerModel(Base):
         return Customer(
             id=self.id,
             name=self.name,
-            email=Email(self.email),
+            email=Email.from_trusted(self.email),
             updated_at=self.updated_at,
             created_at=self.created_at,
         )
@@ -38,15 +38,9 @@ class CustomerModel(Base):
     @staticmethod
     def from_entity(customer: Customer) -> "CustomerModel":
         """Converts the domain entity to the persistence model."""
-        # Extracts the string value from the Email VO
-        email_str = (
-            customer.email.value
-            if isinstance(customer.email, Email)
-            else customer.email
-        )
-
+        # Customer.email is always an Email VO; stores its string value
         model = CustomerModel(
-            id=customer.id, name=customer.name, email=email_str
+            id=customer.id, name=customer.name, email=customer.email.value
         )
 
         if customer.created_at is not None:
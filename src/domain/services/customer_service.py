@@ -19,7 +19,21 @@ class ICustomerUniquenessChecker(Protocol):
     Defines the contract necessary for the Domain Service to query existence.
     """
 
-    async def exists_by_email(self, email: str) -> bool: ...
+    async def exists_by_email(self, email: str) -> bool:
+        """
+        Checks whether a customer already uses the email.
+
+        It runs before every registration, so implementations should only
+        probe for presence (e.g. `SELECT 1 ... LIMIT 1` on the unique email
+        index) and never load or count the matching records.
+
+        Args:
+            email: The email address to check.
+
+        Returns:
+            True if a customer with the email exists, False otherwise.
+        """
+        ...
 
 
 class CustomerRegistrationService:
@@ -51,6 +65,6 @@ class CustomerRegistrationService:
                 already exists.
         """
         # 1. Business Rule: Email uniqueness
-        result = await self.checker.exists_by_email(str(email))
+        result = await self.checker.exists_by_email(email.value)
         if result:
-            raise CustomerAlreadyExistsError(str(email))
+            raise CustomerAlreadyExistsError(email.value)
@@ -7,9 +7,27 @@ emails can be created.
 """
 import re
 from dataclasses import dataclass
+from typing import Self
 
+# Simple regex for email validation, compiled once at import. It is used
+# with fullmatch: a "$" anchor would also accept a trailing newline
+_EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
 
-@dataclass(frozen=True)
+
+def _is_valid(email: str) -> bool:
+    """
+    Checks if an email is valid.
+
+    Args:
+        email: The email to validate.
+
+    Returns:
+        True if the email is valid, False otherwise.
+    """
+    return _EMAIL_PATTERN.fullmatch(email) is not None
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """Value Object to represent a valid and immutable email."""
 
@@ -17,23 +35,27 @@ class Email:
 
     def __post_init__(self) -> None:
         """Validates in the constructor — fails fast if invalid."""
-        if not self._is_valid(self.value):
+        if not _is_valid(self.value):
             raise ValueError(f"Invalid email: {self.value}")
 
-    @staticmethod
-    def _is_valid(email: str) -> bool:
+    @classmethod
+    def from_trusted(cls, value: str) -> Self:
         """
-        Checks if an email is valid.
+        Builds an email without validating it.
+
+        Only meant for values read back from storage, which were validated
+        when first written; everything else must go through the
+        constructor.
 
         Args:
-            email: The email to validate.
+            value: An already validated email address.
 
         Returns:
-            True if the email is valid, False otherwise.
+            The email value object.
         """
-        # Simple regex for email validation
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email) is not None
+        email = object.__new__(cls)
+        object.__setattr__(email, "value", value)
+        return email
 
     def __str__(self) -> str:
         """Returns the string representation of the email."""
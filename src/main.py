@@ -4,25 +4,56 @@ Main application file for the FastAPI service.
 This module initializes the FastAPI application, configures logging,
 and includes the necessary routers and middleware.
 """
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+from src.adapters.api.exception_handlers import register_exception_handlers
 from src.adapters.api.v1.customers.router import router as customers_router
 from src.adapters.api.v1.health_check.router import (
     router as health_check_router,
 )
+from src.adapters.database.session import engine, warm_up_pool
 from src.config.logging import configure_logging
+from src.di.v1.get_create_customer_uc import (
+    get_redis_client,
+    warm_up_redis_pool,
+)
 
 # Configure logging before initializing the application
 configure_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warms up the database and Redis pools on startup and closes them on
+    shutdown.
+
+    Args:
+        app: The FastAPI application.
+    """
+    await asyncio.gather(warm_up_pool(), warm_up_redis_pool())
+    yield
+    await get_redis_client().aclose()
+    await engine.dispose()
+
+
 app = FastAPI(
     title="Customer Service API",
     description="API for managing customers.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 """The main FastAPI application instance."""
 
+register_exception_handlers(app)
+
 app.include_router(health_check_router, prefix="/health", tags=["Health"])
 app.include_router(customers_router, prefix="/api/v1", tags=["Customers"])
 
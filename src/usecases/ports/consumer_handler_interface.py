@@ -1,10 +1,11 @@
 """
 This module defines the interfaces for message handlers (consumers).
 
-It includes a base interface `IConsumerHandler` and a more specific
-`BaseUseCaseHandler` for handlers that execute a use case. These
-interfaces define the contract for processing incoming messages and
-adapting them to the input of a use case.
+It includes a base interface `IConsumerHandler`, a more specific
+`BaseUseCaseHandler` for handlers that execute a use case, and
+`BaseBatchUseCaseHandler` for handlers that can also execute it for
+several inputs at once. These interfaces define the contract for
+processing incoming messages and adapting them to the input of a use case.
 """
 from abc import ABC, abstractmethod
 from typing import Any
@@ -50,3 +51,30 @@ class BaseUseCaseHandler[TMessage, TInput, TOutput](
     ) -> None:
         """Processes the message, usually by managing the Unit of Work."""
         ...
+
+
+class BaseBatchUseCaseHandler[TMessage, TInput, TOutput](
+    BaseUseCaseHandler[TMessage, TInput, TOutput], ABC
+):
+    """
+    Base class for use case handlers that also support batches.
+
+    Lets a batching consumer process the inputs of several messages within
+    a single Unit of Work.
+    """
+
+    @abstractmethod
+    async def handle_batch(
+        self, inputs: list[TInput]
+    ) -> list[Exception | None]:
+        """
+        Processes the inputs of several messages in one Unit of Work.
+
+        Args:
+            inputs: The inputs extracted from the messages.
+
+        Returns:
+            For each input, in order, the error that made it fail or None
+            if it was processed.
+        """
+        ...
@@ -15,6 +15,8 @@ T = TypeVar("T")
 class IHandler[T](ABC):
     """Base class for the handlers in the chain."""
 
+    __slots__ = ("_next_handler",)
+
     def __init__(self, next_handler: "IHandler[T] | None" = None):
         """
         Initializes the handler with an optional next handler.
@@ -2,17 +2,18 @@
 This module defines the interfaces (ports) for persistence and caching.
 
 `IRepository` defines the contract for a generic repository, including
-methods for adding, updating, getting, deleting, searching, and listing
-entities.
+methods for adding (one or many entities), updating, getting, deleting,
+searching, and listing entities.
 
 `ICacheRepository` defines the contract for a generic cache, including
-methods for getting, checking existence, setting, and deleting cache
-entries.
+methods for getting (one or many keys), checking existence, setting, and
+deleting cache entries.
 
 Both interfaces inherit from `IUnitOfWork`, which means that they are
 expected to manage the transaction lifecycle.
 """
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 from uuid import UUID
 
@@ -26,6 +27,19 @@ class IRepository[TInput, TResponse](IUnitOfWork, ABC):
     @abstractmethod
     async def add(self, entity: TInput) -> TResponse: ...
 
+    @abstractmethod
+    async def add_many(self, entities: list[TInput]) -> list[TResponse]: ...
+
+    @abstractmethod
+    async def add_if_absent(self, entity: TInput) -> bool:
+        """
+        Adds the entity unless it conflicts with an existing one.
+
+        Returns:
+            True if the entity was added, False if it already existed.
+        """
+        ...
+
     @abstractmethod
     async def update(self, entity: TInput) -> TResponse: ...
 
@@ -36,10 +50,27 @@ class IRepository[TInput, TResponse](IUnitOfWork, ABC):
     async def delete(self, id: UUID) -> None: ...
 
     @abstractmethod
-    async def search(self, filter: dict[str, Any]) -> list[TResponse]: ...
+    async def search(
+        self,
+        filter: dict[str, Any],
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[TResponse]: ...
+
+    @abstractmethod
+    async def list_all(
+        self, limit: int | None = None, offset: int = 0
+    ) -> list[TResponse]: ...
 
     @abstractmethod
-    async def list_all(self) -> list[TResponse]: ...
+    def savepoint(self) -> AbstractAsyncContextManager[None]:
+        """
+        Opens a nested transaction within the unit of work.
+
+        Changes made inside the block are discarded if it raises, while
+        the rest of the unit of work is kept.
+        """
+        ...
 
 
 class ICacheRepository[TInput, TResponse](IUnitOfWork, ABC):
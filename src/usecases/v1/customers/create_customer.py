@@ -6,14 +6,20 @@ initiating customer creation, which includes checking Redis, validating the
 domain, and publishing a message.
 
 `CustomerCreateUseCase` is responsible for persisting the customer to the
-database.
+database, and `CustomerBatchCreateUseCase` persists several customers at
+once.
 """
 from __future__ import annotations
 
+import asyncio
+import contextlib
+
 from loguru import logger
 
 from src.domain.entities.customer import Customer
+from src.domain.exceptions import CustomerAlreadyExistsError
 from src.domain.services.customer_service import CustomerRegistrationService
+from src.domain.value_objects.email import Email
 from src.usecases.ports.usecase_interface import IUsecase
 from src.usecases.v1.customers.handlers.domain_validation_handler import (
     DomainValidationHandler,
@@ -74,7 +80,17 @@ class InitiateCustomerCreation(IUsecase[CustomerCreate, CustomerRead]):
             The created customer data.
         """
         logger.info(
-            f"Initiating customer creation flow for email: {input_data.email}"
+            "Initiating customer creation flow for email: {}", input_data.email
+        )
+
+        # The database check does not depend on the cache check, so it
+        # starts now and both round trips overlap
+        email = Email(input_data.email)
+        email_check = asyncio.create_task(
+            self.service.validate_email_availability(email)
+        )
+        context = CustomerRegistrationContext(
+            dto=input_data, email=email, email_check=email_check
         )
 
         redis_handler = RedisCheckHandler(self.cache)
@@ -83,12 +99,16 @@ class InitiateCustomerCreation(IUsecase[CustomerCreate, CustomerRead]):
 
         redis_handler.set_next(domain_handler).set_next(publisher_handler)
 
-        context = CustomerRegistrationContext(dto=input_data)
-
-        customer = await redis_handler.handle(context)
+        try:
+            customer = await redis_handler.handle(context)
+        finally:
+            # If the chain stopped early, the check is awaited anyway so the
+            # session is not left mid-query and its error is retrieved
+            with contextlib.suppress(Exception):
+                await email_check
 
         logger.info(
-            f"Customer creation initiated successfully. ID: {customer.id}"
+            "Customer creation initiated successfully. ID: {}", customer.id
         )
 
         return CustomerRead.from_entity(customer)
@@ -118,8 +138,46 @@ class CustomerCreateUseCase(IUsecase[Customer, CustomerRead]):
 
         Returns:
             The created customer data.
+
+        Raises:
+            CustomerAlreadyExistsError: If the customer, or another one with
+                the same email, was already persisted.
+        """
+        logger.info("Persisting customer {} to database.", input_data.id)
+        if not await self.repository.add_if_absent(input_data):
+            raise CustomerAlreadyExistsError(input_data.email.value)
+        logger.info("Customer {} persisted successfully.", input_data.id)
+        return CustomerRead.from_entity(input_data)
+
+
+class CustomerBatchCreateUseCase(IUsecase[list[Customer], list[CustomerRead]]):
+    """Use Case for creating several customers in one transaction."""
+
+    def __init__(
+        self,
+        repository: IDBCustomerRepository,
+    ):
+        """
+        Initializes the use case with its dependencies.
+
+        Args:
+            repository: The database repository.
         """
-        logger.info(f"Persisting customer {input_data.id} to database.")
-        created_customer = await self.repository.add(input_data)
-        logger.info(f"Customer {created_customer.id} persisted successfully.")
-        return CustomerRead.from_entity(created_customer)
+        self.repository = repository
+
+    async def execute(self, input_data: list[Customer]) -> list[CustomerRead]:
+        """
+        Executes the use case.
+
+        Args:
+            input_data: The customers to create.
+
+        Returns:
+            The created customers data.
+        """
+        logger.info("Persisting {} customers to database.", len(input_data))
+        created_customers = await self.repository.add_many(input_data)
+        logger.info(
+            "{} customers persisted successfully.", len(created_customers)
+        )
+        return [CustomerRead.from_entity(c) for c in created_customers]
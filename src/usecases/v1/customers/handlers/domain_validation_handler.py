@@ -8,11 +8,11 @@ checking for email uniqueness and creating a `Customer` entity. It uses the
 """
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
 from loguru import logger
 
 from src.domain.entities.customer import Customer
+from src.domain.ids import new_uuid
 from src.domain.services.customer_service import CustomerRegistrationService
 from src.domain.value_objects.email import Email
 from src.usecases.ports.cor_handler_interface import IHandler
@@ -25,6 +25,8 @@ class DomainValidationHandler(IHandler[CustomerRegistrationContext]):
     """2. Checks in the Database (Source of Truth) and Creates Entity via
     Service."""
 
+    __slots__ = ("service",)
+
     def __init__(
         self,
         service: CustomerRegistrationService,
@@ -50,15 +52,19 @@ class DomainValidationHandler(IHandler[CustomerRegistrationContext]):
         Returns:
             The result of the next handler.
         """
-        email_vo = Email(context.dto.email)
+        email_vo = context.email or Email(context.dto.email)
 
-        logger.info(f"Validating email availability in DB: {email_vo}")
-        # The Service checks in the database (Source of Truth)
-        await self.service.validate_email_availability(email_vo)
+        logger.info("Validating email availability in DB: {}", email_vo)
+        # The Service checks in the database (Source of Truth); the check
+        # may already have been started by the use case
+        if context.email_check is not None:
+            await context.email_check
+        else:
+            await self.service.validate_email_availability(email_vo)
 
         # Creates the entity
         now = datetime.now()
-        customer_id = uuid4()
+        customer_id = new_uuid()
         customer = Customer(
             id=customer_id,
             name=context.dto.name,
@@ -68,7 +74,7 @@ class DomainValidationHandler(IHandler[CustomerRegistrationContext]):
         )
 
         logger.info(
-            f"Domain validation passed. Generated Customer ID: {customer.id}"
+            "Domain validation passed. Generated Customer ID: {}", customer.id
         )
 
         # Passes the created entity to the next step
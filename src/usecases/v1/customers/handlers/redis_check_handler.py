@@ -15,6 +15,8 @@ from src.usecases.v1.schemas.base.customer_registration_context import (
 class RedisCheckHandler(IHandler[CustomerRegistrationContext]):
     """1. Verifica e cadastra no Redis (Short-circuit)."""
 
+    __slots__ = ("cache",)
+
     def __init__(
         self,
         cache: ICustomerControlCache,
@@ -26,16 +28,17 @@ class RedisCheckHandler(IHandler[CustomerRegistrationContext]):
     async def handle(self, context: CustomerRegistrationContext) -> Any:
         email = context.dto.email
 
-        logger.info(f"Checking cache for email: {email}")
-
-        # Verifica se já existe no cache
-        if await self.cache.exists(email):
+        # Verifica e adquire o lock num único comando atômico (SET NX)
+        logger.info("Acquiring lock for email: {}", email)
+        if not await self.cache.acquire_lock(email, "processing", expire=60):
             logger.warning(
-                f"Email {email} already exists in cache (Short-circuit)."
+                "Email {} already exists in cache (Short-circuit).", email
             )
             raise CustomerAlreadyExistsError(email)
 
-        # Cadastra no Redis (Lock temporário)
-        logger.info(f"Acquiring lock for email: {email}")
-        await self.cache.set(email, "processing", expire=60)
-        return await super().handle(context)
+        try:
+            return await super().handle(context)
+        except Exception:
+            # Libera o lock se o cadastro não foi concluído
+            await self.cache.release_lock(email)
+            raise
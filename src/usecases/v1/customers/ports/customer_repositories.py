@@ -37,7 +37,13 @@ class ICustomerControlCache(ICacheRepository[str, str], ABC):
     Herda de ICacheRepository para aproveitar o contrato de UnitOfWork.
     """
 
-    pass
+    @abstractmethod
+    async def acquire_lock(
+        self, key: str, value: str, expire: int
+    ) -> bool: ...
+
+    @abstractmethod
+    async def release_lock(self, key: str) -> None: ...
 
 
 class ICustomerMessagePublisher(BasePublisher[Customer], ABC):
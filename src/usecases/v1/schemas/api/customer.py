@@ -23,10 +23,11 @@ class CustomerRead(CustomerBase):
 
     @staticmethod
     def from_entity(customer: Customer) -> "CustomerRead":
-        return CustomerRead(
+        # A entidade já é válida: model_construct dispensa a revalidação
+        return CustomerRead.model_construct(
             id=customer.id,
             name=customer.name,
-            email=str(customer.email),
+            email=customer.email.value,
             created_at=customer.created_at,
             updated_at=customer.updated_at,
         )
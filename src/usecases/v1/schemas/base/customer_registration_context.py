@@ -1,14 +1,20 @@
-from pydantic import BaseModel, ConfigDict
+import asyncio
+from dataclasses import dataclass
 
 from src.domain.entities.customer import Customer
+from src.domain.value_objects.email import Email
 from src.usecases.v1.schemas.api.customer import CustomerCreate
 
 
-class CustomerRegistrationContext(BaseModel):
+# Dataclass, não modelo Pydantic: o DTO já chega validado e o contexto é
+# criado a cada requisição
+@dataclass(slots=True)
+class CustomerRegistrationContext:
     """Contexto compartilhado entre os handlers da criação de cliente."""
 
     dto: CustomerCreate
     customer: Customer | None = None
-
-    # Permite armazenar a Entidade de Domínio (que não é Pydantic)
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # Email já validado, para não repetir a validação em cada handler
+    email: Email | None = None
+    # Checagem de email no banco já iniciada, em paralelo com o cache
+    email_check: asyncio.Task[None] | None = None
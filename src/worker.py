@@ -55,5 +55,21 @@ async def main() -> None:
     # you might need to explicitly stop the consumers.
 
 
+def run() -> None:
+    """
+    Runs the worker on uvloop when it is available.
+
+    uvloop speeds up the task scheduling and socket I/O the consumers rely
+    on to bridge Pub/Sub threads and database calls into asyncio; the
+    stock event loop is used where uvloop is not installed (e.g. Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -0,0 +1,186 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.adapters.consumers.handlers.batching_handler import BatchingHandler
+from src.adapters.consumers.handlers.create_customer_handler import (
+    CreateCustomerHandler,
+)
+from src.domain.exceptions import CustomerAlreadyExistsError
+
+
+class FakeBatchHandler:
+    """Handler de lotes que registra cada lote recebido."""
+
+    def __init__(self, errors=None):
+        self.batches = []
+        self.errors = errors
+
+    def extract_input(self, message, context):
+        return message
+
+    async def handle_batch(self, inputs):
+        self.batches.append(list(inputs))
+        if self.errors is not None:
+            return self.errors
+        return [None] * len(inputs)
+
+
+class FakeUnitOfWork:
+    """Unit of Work sem banco, com savepoints que só propagam erros."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    @asynccontextmanager
+    async def savepoint(self):
+        yield
+
+
+class FailingBatchUseCase:
+    """Caso de uso em lote que sempre falha (ex: violação de unicidade)."""
+
+    async def execute(self, input_data):
+        raise RuntimeError("batch insert failed")
+
+
+class PerItemUseCase:
+    """Caso de uso unitário com o resultado definido por item."""
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    async def execute(self, input_data):
+        error = self.outcomes[input_data]
+        if error is not None:
+            raise error
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+class TestBatchingHandler:
+    def test_flushes_when_batch_is_full(self):
+        """
+        Um lote cheio é processado imediatamente,
+        sem esperar o intervalo de flush.
+        """
+        handler = FakeBatchHandler()
+        batching = BatchingHandler(
+            handler, max_batch_size=3, flush_interval=60
+        )
+
+        async def scenario():
+            await asyncio.gather(
+                *(batching.handle_message(i, {}) for i in range(3))
+            )
+
+        run(scenario())
+
+        assert handler.batches == [[0, 1, 2]]
+
+    def test_flushes_after_interval(self):
+        """
+        Um lote incompleto é processado quando o intervalo expira.
+        """
+        handler = FakeBatchHandler()
+        batching = BatchingHandler(
+            handler, max_batch_size=100, flush_interval=0.05
+        )
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(
+                batching.handle_message("a", {}),
+                batching.handle_message("b", {}),
+            )
+            return loop.time() - start
+
+        elapsed = run(scenario())
+
+        assert handler.batches == [["a", "b"]]
+        assert elapsed >= 0.05
+
+    def test_batch_failure_falls_back_to_per_item_results(self):
+        """
+        Se o lote falha, cada item é refeito no seu savepoint:
+        duplicados contam como processados e só o item com erro falha.
+        """
+        failure = RuntimeError("bad customer")
+        handler = CreateCustomerHandler(
+            uow_factory=FakeUnitOfWork,
+            usecase_factory=lambda uow: PerItemUseCase(
+                {
+                    "ok": None,
+                    "dup": CustomerAlreadyExistsError("dup@example.com"),
+                    "bad": failure,
+                }
+            ),
+            batch_usecase_factory=lambda uow: FailingBatchUseCase(),
+        )
+        handler.extract_input = lambda message, context: message
+        batching = BatchingHandler(
+            handler, max_batch_size=3, flush_interval=60
+        )
+
+        async def scenario():
+            return await asyncio.gather(
+                *(
+                    batching.handle_message(item, {})
+                    for item in ("ok", "dup", "bad")
+                ),
+                return_exceptions=True,
+            )
+
+        assert run(scenario()) == [None, None, failure]
+
+    def test_mismatched_results_fail_the_whole_batch(self):
+        """
+        Um handler que devolve resultados a menos falha todos os itens,
+        em vez de deixar os chamadores esperando.
+        """
+        handler = FakeBatchHandler(errors=[None])
+        batching = BatchingHandler(
+            handler, max_batch_size=2, flush_interval=60
+        )
+
+        async def scenario():
+            return await asyncio.gather(
+                batching.handle_message(1, {}),
+                batching.handle_message(2, {}),
+                return_exceptions=True,
+            )
+
+        results = run(scenario())
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_cancelled_caller_does_not_affect_the_batch(self):
+        """
+        Cancelar um chamador não impede o processamento
+        dos demais nem dos lotes seguintes.
+        """
+        handler = FakeBatchHandler()
+        batching = BatchingHandler(
+            handler, max_batch_size=100, flush_interval=0.05
+        )
+
+        async def scenario():
+            cancelled = asyncio.create_task(batching.handle_message(1, {}))
+            kept = asyncio.create_task(batching.handle_message(2, {}))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await kept
+            await batching.handle_message(3, {})
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+
+        run(scenario())
+
+        assert handler.batches == [[1, 2], [3]]
@@ -0,0 +1,59 @@
+import pytest
+
+from src.adapters.consumers.pubsub_consumers import recent_messages
+from src.adapters.consumers.pubsub_consumers.recent_messages import (
+    RecentMessages,
+)
+
+
+class FakeClock:
+    """Relógio monotônico controlado pelo teste."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRecentMessages:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr(recent_messages.time, "monotonic", clock)
+        return clock
+
+    def test_remembers_added_ids(self, clock):
+        """Ids adicionados são reconhecidos; os demais não."""
+        recent = RecentMessages(max_size=10, ttl=60)
+        recent.add("a")
+
+        assert "a" in recent
+        assert "b" not in recent
+        assert 1 not in recent
+
+    def test_ids_expire_after_ttl(self, clock):
+        """Um id deixa de ser reconhecido depois do TTL."""
+        recent = RecentMessages(max_size=10, ttl=60)
+        recent.add("a")
+
+        clock.now += 59
+        assert "a" in recent
+
+        clock.now += 2
+        assert "a" not in recent
+
+    def test_evicts_least_recently_added(self, clock):
+        """
+        Acima do tamanho máximo, o id adicionado há mais tempo é esquecido;
+        readicionar um id o torna o mais recente.
+        """
+        recent = RecentMessages(max_size=2, ttl=60)
+        recent.add("a")
+        recent.add("b")
+        recent.add("a")
+        recent.add("c")
+
+        assert "a" in recent
+        assert "b" not in recent
+        assert "c" in recent